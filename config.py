@@ -22,6 +22,10 @@ logging.basicConfig(
 # Kaiten Configuration
 KAITEN_API_URL = os.getenv('KAITEN_API_URL')
 KAITEN_API_KEY = os.getenv('KAITEN_API_KEY')
+# Keep-alive connections pooled for Kaiten API requests
+KAITEN_POOL_SIZE = int(os.getenv('KAITEN_POOL_SIZE', '32'))
+# Maximum Kaiten API requests per minute; unset or 0 disables client-side throttling
+KAITEN_RPM_LIMIT = int(os.getenv('KAITEN_RPM_LIMIT', '0')) or None
 
 # Planka Configuration
 PLANKA_API_URL = os.getenv('PLANKA_API_URL')
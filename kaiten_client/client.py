@@ -4,15 +4,70 @@ Uses the official kaiten package.
 """
 
 import logging
+import threading
 import time
-from typing import Dict, Any, List
+import requests
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, Any, List, Optional
 from kaiten import KaitenClient as KaitenAPIClient
 
 logger = logging.getLogger(__name__)
 
+# Keep-alive connections kept open to Kaiten; the migrator reads cards from several threads
+POOL_SIZE = 32
+
+# Retry policy for Kaiten reads: jittered exponential backoff that defers to Retry-After on 429/503
+# Built at import, so urllib3>=2.0 (pinned in requirements.txt) is needed for backoff_jitter
+KAITEN_RETRY = Retry(
+    total=3,
+    backoff_factor=0.5,
+    backoff_jitter=0.5,
+    status_forcelist=[429, 500, 502, 503, 504],
+    allowed_methods=frozenset(["GET", "HEAD"]),
+    respect_retry_after_header=True,
+    raise_on_status=False
+)
+
+# Spaces whose boards are fetched at the same time by get_boards()
+DISCOVERY_WORKERS = 4
+
+# Length in seconds of the window the requests-per-minute limit is counted over
+RATE_WINDOW = 60.0
+
+
+class _RateLimiter:
+    """
+    Sliding-window limit on requests per minute, shared by all threads.
+    
+    Requests wait before they are sent instead of being answered with 429
+    and retried. Without a limit, wait() never blocks.
+    """
+
+    def __init__(self, rpm_limit: Optional[int] = None):
+        self.rpm_limit = rpm_limit
+        self._sent = deque()
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        """Block until one more request fits into the window, then record it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._sent and now - self._sent[0] >= RATE_WINDOW:
+                    self._sent.popleft()
+                if not self.rpm_limit or len(self._sent) < self.rpm_limit:
+                    self._sent.append(now)
+                    return
+                delay = RATE_WINDOW - (now - self._sent[0])
+            time.sleep(delay)
+
 
 class KaitenClient:
-    def __init__(self, api_url: str, api_key: str):
+    def __init__(self, api_url: str, api_key: str, pool_size: int = POOL_SIZE,
+                 rpm_limit: Optional[int] = None):
         # Remove trailing slash and adjust URL if needed
         clean_url = api_url.rstrip('/')
         if '/api/v1' in clean_url:
@@ -21,16 +76,37 @@ class KaitenClient:
         self.api_url = clean_url
         self.api_key = api_key
         self.client = KaitenAPIClient(self.api_url, self.api_key)
+        
+        # One pooled session for the direct API calls, so connections are reused between requests
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            pool_block=False,
+            max_retries=KAITEN_RETRY
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update(self.client.headers)
+        self._rate_limiter = _RateLimiter(rpm_limit)
+
+    def close(self):
+        """Close the pooled HTTP session."""
+        self.session.close()
+
+    def _get(self, url: str) -> requests.Response:
+        """GET a Kaiten URL through the pooled session, within the configured rate limit."""
+        self._rate_limiter.wait()
+        return self.session.get(url)
 
     def get_spaces(self) -> List[Dict[str, Any]]:
         """Get all spaces from Kaiten."""
         try:
             # The underlying library does not expose the request, so we do it manually
             # to get more details on errors.
-            import requests
             spaces_url = f"{self.api_url}/api/v1/spaces"
             logger.info(f"Fetching spaces from {spaces_url}")
-            response = requests.get(spaces_url, headers=self.client.headers)
+            response = self._get(spaces_url)
             if response.status_code != 200:
                 logger.error(f"Error fetching spaces. Status: {response.status_code}, Body: {response.text}")
                 return []
@@ -44,10 +120,9 @@ class KaitenClient:
     def get_columns(self, board_id: int) -> List[Dict[str, Any]]:
         """Get all columns (lists) for a specific board from Kaiten."""
         try:
-            import requests
             columns_url = f"{self.api_url}/api/v1/boards/{board_id}/columns"
             logger.info(f"Fetching columns from URL: {columns_url}")
-            response = requests.get(columns_url, headers=self.client.headers)
+            response = self._get(columns_url)
             logger.info(f"Received response with status code: {response.status_code}")
             if response.status_code != 200:
                 logger.error(f"Error response from server: {response.text}")
@@ -60,10 +135,9 @@ class KaitenClient:
     def get_boards_for_space(self, space_id: int) -> List[Dict[str, Any]]:
         """Get all boards for a specific space from Kaiten."""
         try:
-            import requests
             space_boards_url = f"{self.api_url}/api/v1/spaces/{space_id}/boards"
             logger.info(f"Fetching boards from URL: {space_boards_url}")
-            response = requests.get(space_boards_url, headers=self.client.headers)
+            response = self._get(space_boards_url)
             logger.info(f"Received response with status code: {response.status_code}")
             if response.status_code != 200:
                 logger.error(f"Error response from server: {response.text}")
@@ -78,17 +152,20 @@ class KaitenClient:
         logger.info("Attempting to fetch all boards from Kaiten.")
         all_boards = []
         spaces = self.get_spaces()
-        for space in spaces:
-            time.sleep(0.2)  # Add a small delay to avoid rate limiting
-            boards = self.get_boards_for_space(space['id'])
-            if boards:
-                all_boards.extend(boards)
+        # Spaces are independent, so their boards are fetched concurrently; each request
+        # still waits for the RPM limiter in _get, and 429s are retried per KAITEN_RETRY
+        with ThreadPoolExecutor(max_workers=DISCOVERY_WORKERS) as executor:
+            for boards in executor.map(lambda space: self.get_boards_for_space(space['id']), spaces):
+                if boards:
+                    all_boards.extend(boards)
         return all_boards
 
     def get_cards(self, board_id: int) -> List[Dict[str, Any]]:
         """Get all cards from a specific board."""
         try:
-            # Use the list_of.cards method with board_id filter
+            # Use the list_of.cards method with board_id filter. The library sends its own
+            # request outside self.session, so only the RPM limit (not KAITEN_RETRY) applies
+            self._rate_limiter.wait()
             cards = self.client.list_of().cards(board_id=board_id)
             # Convert Card objects to dictionaries
             return [card.__dict__ for card in cards]
@@ -99,9 +176,8 @@ class KaitenClient:
     def get_card_details(self, card_id: int) -> Dict[str, Any]:
         """Get detailed information about a specific card."""
         try:
-            import requests
             card_url = f"{self.api_url}/api/v1/cards/{card_id}"
-            response = requests.get(card_url, headers=self.client.headers)
+            response = self._get(card_url)
             if response.status_code == 200:
                 return response.json()
             else:
@@ -114,6 +190,7 @@ class KaitenClient:
     def get_users(self) -> List[Dict[str, Any]]:
         """Get all users from Kaiten."""
         try:
+            self._rate_limiter.wait()
             users = self.client.list_of().users()
             # Convert User objects to dictionaries
             return [user.__dict__ for user in users]
@@ -124,9 +201,8 @@ class KaitenClient:
     def get_user_by_id(self, user_id: int) -> Dict[str, Any]:
         """Get a specific user by ID from Kaiten."""
         try:
-            import requests
             user_url = f"{self.api_url}/api/v1/users/{user_id}"
-            response = requests.get(user_url, headers=self.client.headers)
+            response = self._get(user_url)
             if response.status_code == 200:
                 return response.json()
             else:
@@ -139,6 +215,7 @@ class KaitenClient:
     def get_tags(self) -> List[Dict[str, Any]]:
         """Get all tags from Kaiten."""
         try:
+            self._rate_limiter.wait()
             tags = self.client.list_of().tags()
             # Convert Tag objects to dictionaries
             return [tag.__dict__ for tag in tags]
@@ -159,9 +236,8 @@ class KaitenClient:
     def get_checklist_details(self, card_id: int, checklist_id: int) -> Dict[str, Any]:
         """Get detailed information about a specific checklist."""
         try:
-            import requests
             checklist_url = f"{self.api_url}/api/v1/cards/{card_id}/checklists/{checklist_id}"
-            response = requests.get(checklist_url, headers=self.client.headers)
+            response = self._get(checklist_url)
             if response.status_code == 200:
                 return response.json()
             else:
@@ -176,10 +252,9 @@ class KaitenClient:
         try:
             # Attachments are not directly available in the kaiten package
             # We need to make a direct API call
-            import requests
             # Use the original URL with /api/v1 prefix
             attachments_url = f"{self.api_url}/api/v1/cards/{card_id}/files"
-            response = requests.get(attachments_url, headers=self.client.headers)
+            response = self._get(attachments_url)
             if response.status_code == 200:
                 return response.json()
             else:
@@ -192,9 +267,8 @@ class KaitenClient:
     def get_card_comments(self, card_id: int) -> List[Dict[str, Any]]:
         """Get all comments for a specific card."""
         try:
-            import requests
             comments_url = f"{self.api_url}/api/v1/cards/{card_id}/comments"
-            response = requests.get(comments_url, headers=self.client.headers)
+            response = self._get(comments_url)
             if response.status_code == 200:
                 return response.json()
             else:
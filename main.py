@@ -4,11 +4,6 @@ Main script for migrating data from Kaiten to Planka.
 """
 
 import logging
-import sys
-import os
-
-# Add current directory to Python path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from kaiten_client import KaitenClient
 from planka_client import PlankaClient
@@ -25,7 +20,9 @@ def main():
     # Initialize Kaiten client
     kaiten_client = KaitenClient(
         api_url=config.KAITEN_API_URL,
-        api_key=config.KAITEN_API_KEY
+        api_key=config.KAITEN_API_KEY,
+        pool_size=config.KAITEN_POOL_SIZE,
+        rpm_limit=config.KAITEN_RPM_LIMIT
     )
 
     # Initialize Planka client
@@ -34,71 +31,77 @@ def main():
         api_key=config.PLANKA_API_KEY
     )
     
-    # Clean all existing projects in Planka before migration
-    # logger.info("Cleaning all existing projects in Planka")
-    # if not planka_client.delete_all_boards_and_projects():
-    #     logger.error("Failed to clean existing projects in Planka")
-    #     return
-    
-    # Verify that all projects are deleted
-    # try:
-    #     existing_projects = planka_client.get_projects()
-    #     logger.info(f"Found {len(existing_projects)} existing projects after cleanup")
-    #     if existing_projects:
-    #         logger.warning("Some projects still exist after cleanup. This may cause issues.")
-    #         # Continue anyway, but log the warning
-    # except Exception as e:
-    #     logger.error(f"Error while verifying cleanup: {e}")
     # Initialize migrator
     migrator = KaitenToPlankaMigrator(kaiten_client, planka_client)
+    try:
+        # Clean all existing projects in Planka before migration
+        # logger.info("Cleaning all existing projects in Planka")
+        # if not planka_client.delete_all_boards_and_projects():
+        #     logger.error("Failed to clean existing projects in Planka")
+        #     return
+        
+        # Verify that all projects are deleted
+        # try:
+        #     existing_projects = planka_client.get_projects()
+        #     logger.info(f"Found {len(existing_projects)} existing projects after cleanup")
+        #     if existing_projects:
+        #         logger.warning("Some projects still exist after cleanup. This may cause issues.")
+        #         # Continue anyway, but log the warning
+        # except Exception as e:
+        #     logger.error(f"Error while verifying cleanup: {e}")
 
-    # First, migrate all users
-    # migrator.migrate_users()
+        # First, migrate all users
+        # migrator.migrate_users()
 
-    # Then, iterate through spaces and migrate each one as a separate project
-    kaiten_spaces = kaiten_client.get_spaces()
-    if not kaiten_spaces:
-        logger.warning("No spaces found in Kaiten. Nothing to migrate.")
-        return
+        # Then, iterate through spaces and migrate each one as a separate project
+        kaiten_spaces = kaiten_client.get_spaces()
+        if not kaiten_spaces:
+            logger.warning("No spaces found in Kaiten. Nothing to migrate.")
+            return
 
-    # Process all spaces from Kaiten
-    for space in kaiten_spaces:
-        # Set space_name as Kaiten Project name only (as requested)
-        space_name = space.get('title', f"Kaiten Space {space['id']}")
-        logger.info(f"Processing space: {space_name}")
+        # Process all spaces from Kaiten
+        for space in kaiten_spaces:
+            # Set space_name as Kaiten Project name only (as requested)
+            space_name = space.get('title', f"Kaiten Space {space['id']}")
+            logger.info(f"Processing space: {space_name}")
 
-        # Create a new project in Planka for this space
-        try:
-            
-            if "WiFi Adapters UI" in space_name:
-                ic(space_name)
-                project = planka_client.create_project(
-                    name=space_name,  # Only the Kaiten Project name, nothing else
-                    description=" ",  # Space character instead of empty string to avoid API error
-                    type="private"
-                )
+            # Create a new project in Planka for this space
+            try:
                 
-                # Check if project was created successfully
-                if not project or 'id' not in project:
-                    logger.error(f"Failed to create project in Planka for space {space_name}. Response: {project}")
-                    continue  # Skip to the next space
+                if "WiFi Adapters UI" in space_name:
+                    ic(space_name)
+                    project = planka_client.create_project(
+                        name=space_name,  # Only the Kaiten Project name, nothing else
+                        description=" ",  # Space character instead of empty string to avoid API error
+                        type="private"
+                    )
                     
-                project_id = project['id']
-                logger.info(f"Created new project in Planka: {project.get('name', project_id)}")
+                    # Check if project was created successfully
+                    if not project or 'id' not in project:
+                        logger.error(f"Failed to create project in Planka for space {space_name}. Response: {project}")
+                        continue  # Skip to the next space
+                        
+                    project_id = project['id']
+                    logger.info(f"Created new project in Planka: {project.get('name', project_id)}")
 
-                # Get boards for this space
-                kaiten_boards = kaiten_client.get_boards_for_space(space['id'])
-                if kaiten_boards:
-                    # Perform migration for this space's data
-                    migrator.migrate_space_data(project_id, kaiten_boards)
-                else:
-                    logger.info(f"No boards found in space: {space_name}")
+                    # Get boards for this space
+                    kaiten_boards = kaiten_client.get_boards_for_space(space['id'])
+                    if kaiten_boards:
+                        # Perform migration for this space's data
+                        migrator.migrate_space_data(project_id, kaiten_boards)
+                    else:
+                        logger.info(f"No boards found in space: {space_name}")
+            
+            except Exception as e:
+                logger.error(f"An error occurred while processing space {space_name}: {e}")
+                continue
         
-        except Exception as e:
-            logger.error(f"An error occurred while processing space {space_name}: {e}")
-            continue
-    
-    logger.info("Migration process finished.")
+        logger.info("Migration process finished.")
+    finally:
+        # Shut down the worker pools and HTTP sessions on every exit path
+        migrator.close()
+        planka_client.close()
+        kaiten_client.close()
 
 
 if __name__ == "__main__":
@@ -6,9 +6,11 @@
 """
 import requests
 import os
+import re
 from typing import Optional, List, Dict, Any
 from plankapy import Planka, PasswordAuth
 from planka_client import PlankaClient
+from planka_client.client import REQUEST_TIMEOUT
 import logging
 from dotenv import load_dotenv
 
@@ -42,7 +44,8 @@ def get_api_token(base_url: str, username: str, password: str) -> Optional[str]:
             data={
                 'emailOrUsername': username,
                 'password': password
-            }
+            },
+            timeout=REQUEST_TIMEOUT
         )
         
         if response.status_code == 200:
@@ -62,7 +65,6 @@ def save_api_key_to_env(api_key: str, env_file_path: str = '.env') -> bool:
     """
     Saves the API key to the .env file.
     """
-    import re
     try:
         env_content = ""
         if os.path.exists(env_file_path):
@@ -99,12 +101,8 @@ def get_board_details(planka: PlankaClient, board_id: str) -> Optional[Dict[str,
     """
     try:
         url = f"{planka.api_url}/boards/{board_id}"
-        headers = {
-            "Authorization": f"Bearer {planka.api_key}",
-            "Content-Type": "application/json"
-        }
         
-        response = requests.get(url, headers=headers)
+        response = planka.session.get(url, timeout=REQUEST_TIMEOUT)
         
         if response.status_code == 200:
             return response.json()
@@ -132,18 +130,16 @@ def create_board_in_project(planka: PlankaClient, project_id: str, board_name: s
     """
     try:
         url = f"{planka.api_url}/projects/{project_id}/boards"
-        headers = {
-            "Authorization": f"Bearer {planka.api_key}",
-            "Content-Type": "application/json"
-        }
         data = {
             "name": board_name,
             "position": position
         }
         
-        response = requests.post(url, headers=headers, json=data)
+        response = planka.session.post(url, json=data, timeout=REQUEST_TIMEOUT)
         
         if response.status_code in [200, 201]:
+            # Запрос шел мимо клиента, поэтому его кэш досок/списков устарел
+            planka.invalidate_cache()
             return response.json()
         else:
             logger.error(f"Error creating board: HTTP {response.status_code} - {response.text}")
@@ -170,10 +166,6 @@ def create_list_in_board(planka: PlankaClient, board_id: str, list_name: str, po
     """
     try:
         url = f"{planka.api_url}/boards/{board_id}/lists"
-        headers = {
-            "Authorization": f"Bearer {planka.api_key}",
-            "Content-Type": "application/json"
-        }
         
         # Обрабатываем null/None имена списков
         if not list_name or (isinstance(list_name, str) and list_name.strip() == ''):
@@ -186,9 +178,11 @@ def create_list_in_board(planka: PlankaClient, board_id: str, list_name: str, po
             "type": "normal"  # ОБЯЗАТЕЛЬНЫЙ параметр для API Planka!
         }
         
-        response = requests.post(url, headers=headers, json=data)
+        response = planka.session.post(url, json=data, timeout=REQUEST_TIMEOUT)
         
         if response.status_code in [200, 201]:
+            # Запрос шел мимо клиента, поэтому его кэш досок/списков устарел
+            planka.invalidate_cache()
             return response.json()
         else:
             logger.error(f"Error creating list '{list_name}': HTTP {response.status_code} - {response.text}")
@@ -214,10 +208,6 @@ def create_card_in_list(planka: PlankaClient, board_id: str, list_id: str, card_
     """
     try:
         url = f"{planka.api_url}/boards/{board_id}/cards"
-        headers = {
-            "Authorization": f"Bearer {planka.api_key}",
-            "Content-Type": "application/json"
-        }
         
         data = {
             "listId": list_id,
@@ -229,7 +219,7 @@ def create_card_in_list(planka: PlankaClient, board_id: str, list_id: str, card_
         if 'description' in card_data and card_data['description']:
             data['description'] = card_data['description']
         
-        response = requests.post(url, headers=headers, json=data)
+        response = planka.session.post(url, json=data, timeout=REQUEST_TIMEOUT)
         
         if response.status_code in [200, 201]:
             return response.json()
@@ -253,23 +243,8 @@ def delete_board(planka: PlankaClient, board_id: str) -> bool:
     Returns:
         True если успешно, False при ошибке
     """
-    try:
-        url = f"{planka.api_url}/boards/{board_id}"
-        headers = {
-            "Authorization": f"Bearer {planka.api_key}",
-        }
-        
-        response = requests.delete(url, headers=headers)
-        
-        if response.status_code in [200, 204]:
-            return True
-        else:
-            logger.error(f"Error deleting board: HTTP {response.status_code} - {response.text}")
-            return False
-            
-    except Exception as e:
-        logger.error(f"Exception deleting board: {e}")
-        return False
+    # Через клиент, а не planka.session: так доска убирается и из его индексов и кэшей
+    return planka.delete_board_with_contents(board_id)
 
 
 def move_board_with_content(planka: PlankaClient, board: object, target_project: object, 
@@ -656,9 +631,13 @@ def consolidate_all_boards(planka: PlankaClient) -> None:
     boards_by_project = {}
     
     for project in projects:
-        if project.id != target_project.id and project.boards:
-            boards_by_project[project.name] = list(project.boards)
-            total_boards += len(project.boards)
+        if project.id == target_project.id:
+            continue
+        # plankapy fetches project.boards over HTTP on every access, so read it once
+        boards = list(project.boards)
+        if boards:
+            boards_by_project[project.name] = boards
+            total_boards += len(boards)
     
     if total_boards == 0:
         print(f"\n⚠ Нет досок для перемещения в '{target_project.name}'")
@@ -739,15 +718,11 @@ def add_manager_to_all_projects(planka: PlankaClient, manager: object) -> None:
                 skip_count += 1
             else:
                 url = f"{planka.api_url}/projects/{project.id}/project-managers"
-                headers = {
-                    "Authorization": f"Bearer {planka.api_key}",
-                    "Content-Type": "application/json"
-                }
                 data = {
                     "userId": manager.id
                 }
                 
-                response = requests.post(url, headers=headers, json=data)
+                response = planka.session.post(url, json=data, timeout=REQUEST_TIMEOUT)
                 
                 if response.status_code in [200, 201]:
                     print(f"  ✓ {project.name}: Успешно добавлен")
@@ -3,13 +3,29 @@ Comprehensive migration module for transferring data from Kaiten to Planka.
 """
 
 import logging
+import os
 import re
-from typing import Dict, Any, List
+import tempfile
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Set
+from requests.adapters import HTTPAdapter
 from kaiten_client import KaitenClient
 from planka_client import PlankaClient
 
 logger = logging.getLogger(__name__)
 
+# Planka rejects large uploads, so attachments above this size are skipped
+MAX_ATTACHMENT_SIZE = 10 * 1024 * 1024  # 10MB
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+# (connect, read) timeout in seconds for attachment downloads, so a stalled server can't hang a worker
+DOWNLOAD_TIMEOUT = (5, 60)
+# Worker threads, shared by all cards, that create checklist items and transfer attachments
+ITEM_WORKERS = 8
+# Cards of a board migrated concurrently; with the item workers this bounds the
+# in-flight Planka requests at CARD_WORKERS + ITEM_WORKERS, below the client's connection pool
+CARD_WORKERS = 4
+
 
 class KaitenToPlankaMigrator:
     def __init__(self, kaiten_client: KaitenClient, planka_client: PlankaClient):
@@ -19,6 +35,21 @@ class KaitenToPlankaMigrator:
         self.kaiten_to_planka_board_map: Dict[int, str] = {}
         self.kaiten_to_planka_list_map: Dict[int, str] = {}
         self.kaiten_to_planka_label_map: Dict[int, str] = {}
+        # Emails of users known to exist in Planka; filled on first migrate_users call
+        self._planka_emails_cache: Optional[Set[str]] = None
+        # One bounded pool for the per-card item work, instead of a new pool per card and checklist
+        self._item_executor = ThreadPoolExecutor(max_workers=ITEM_WORKERS)
+        # Pooled session for attachment downloads. It carries no Kaiten headers: the files may
+        # live on another host (e.g. presigned S3 URLs), which must not receive the API key
+        self._download_session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=ITEM_WORKERS, pool_maxsize=ITEM_WORKERS)
+        self._download_session.mount("http://", adapter)
+        self._download_session.mount("https://", adapter)
+
+    def close(self):
+        """Shut down the worker threads shared by the card pipelines and the download session."""
+        self._item_executor.shutdown(wait=True)
+        self._download_session.close()
 
     def migrate_users(self):
         """Migrate users from Kaiten to Planka."""
@@ -28,13 +59,15 @@ class KaitenToPlankaMigrator:
             logger.warning("No users found in Kaiten to migrate.")
             return
 
-        # Get existing planka users to prevent duplicates
-        try:
-            planka_users = self.planka_client.get_users()
-            planka_emails = {user['email'] for user in planka_users if 'email' in user}
-        except Exception as e:
-            logger.error(f"Error fetching Planka users: {e}")
-            planka_emails = set()
+        # Get existing planka users to prevent duplicates (fetched only once per migrator)
+        if self._planka_emails_cache is None:
+            try:
+                planka_users = self.planka_client.get_users()
+                self._planka_emails_cache = {user['email'] for user in planka_users if 'email' in user}
+            except Exception as e:
+                logger.error(f"Error fetching Planka users: {e}")
+                self._planka_emails_cache = set()
+        planka_emails = self._planka_emails_cache
 
         for user in kaiten_users:
             email = user.get('email')
@@ -57,6 +90,7 @@ class KaitenToPlankaMigrator:
                 )
                 if planka_user and 'id' in planka_user:
                     self.kaiten_to_planka_user_map[user['id']] = planka_user['id']
+                    planka_emails.add(email)
                     logger.info(f"Created user: {user['full_name']}")
                 else:
                     logger.error(f"Failed to create user {user['full_name']}: Invalid response from Planka API")
@@ -105,152 +139,198 @@ class KaitenToPlankaMigrator:
         # Get cards from Kaiten board
         kaiten_cards = self.kaiten_client.get_cards(kaiten_board_id)
         
-        for kaiten_card in kaiten_cards:
-            try:
-                # Get detailed card information
-                card_details = self.kaiten_client.get_card_details(kaiten_card['id'])
+        # Cards without a known column go to the first available list, or the default one
+        fallback_list_id = next(iter(column_to_list_map.values())) if column_to_list_map else default_list_id
+        
+        # Each card is an independent create card -> checklists -> items chain, so cards are
+        # migrated concurrently; explicit positions keep the Kaiten order despite that
+        with ThreadPoolExecutor(max_workers=CARD_WORKERS) as executor:
+            list(executor.map(
+                lambda indexed_card: self._migrate_card(
+                    indexed_card[1],
+                    column_to_list_map.get(indexed_card[1].get('column_id'), fallback_list_id),
+                    (indexed_card[0] + 1) * 65535
+                ),
+                enumerate(kaiten_cards)
+            ))
+
+    def _migrate_card(self, kaiten_card: Dict[str, Any], target_list_id: str, position: int):
+        """Create a single Kaiten card in Planka together with its checklists, attachments, comments and links."""
+        try:
+            # Get detailed card information
+            card_details = self.kaiten_client.get_card_details(kaiten_card['id'])
+            
+            # Create card in Planka
+            planka_card = self.planka_client.create_card(
+                list_id=target_list_id,
+                name=kaiten_card['title'],
+                description=card_details.get('description', ''),
+                position=position
+            )
+            
+            if planka_card and 'id' in planka_card:
+                planka_card_id = planka_card['id']
+                logger.info(f"Created card: {kaiten_card['title']} in list {target_list_id}")
                 
-                # Determine which list this card should go to
-                target_list_id = None
-                if 'column_id' in kaiten_card and kaiten_card['column_id'] in column_to_list_map:
-                    target_list_id = column_to_list_map[kaiten_card['column_id']]
-                elif column_to_list_map:
-                    # Put in the first available list
-                    target_list_id = next(iter(column_to_list_map.values()))
-                else:
-                    # Put in default list
-                    target_list_id = default_list_id
+                # Migrate checklists for this card
+                self.migrate_checklists(kaiten_card['id'], planka_card_id)
                 
-                # Create card in Planka
-                planka_card = self.planka_client.create_card(
-                    list_id=target_list_id,
-                    name=kaiten_card['title'],
-                    description=card_details.get('description', ''),
-                )
+                # Migrate attachments for this card
+                self.migrate_attachments(kaiten_card['id'], planka_card_id)
                 
-                if planka_card and 'id' in planka_card:
-                    planka_card_id = planka_card['id']
-                    logger.info(f"Created card: {kaiten_card['title']} in list {target_list_id}")
-                    
-                    # Migrate checklists for this card
-                    self.migrate_checklists(kaiten_card['id'], planka_card_id)
-                    
-                    # Migrate attachments for this card
-                    self.migrate_attachments(kaiten_card['id'], planka_card_id)
-                    
-                    # Migrate comments for this card
-                    self.migrate_comments(kaiten_card['id'], planka_card_id)
-                    
-                    # Migrate external links for this card
-                    self.migrate_external_links(kaiten_card['id'], planka_card_id)
-                else:
-                    logger.error(f"Failed to create card {kaiten_card['title']}")
-            except Exception as e:
-                logger.error(f"Failed to create card {kaiten_card['title']}: {e}")
+                # Migrate comments for this card
+                self.migrate_comments(kaiten_card['id'], planka_card_id)
+                
+                # Migrate external links for this card
+                self.migrate_external_links(kaiten_card['id'], planka_card_id)
+            else:
+                logger.error(f"Failed to create card {kaiten_card['title']}")
+        except Exception as e:
+            logger.error(f"Failed to create card {kaiten_card['title']}: {e}")
 
     
     def migrate_checklists(self, kaiten_card_id: int, planka_card_id: str):
         """Migrate checklists from a Kaiten card to a Planka card."""
         try:
             kaiten_checklists = self.kaiten_client.get_checklists(kaiten_card_id)  # список чек-листов
-            for checklist in kaiten_checklists:
-                # Детализация (для элементов)
-                checklist_id = checklist.get('id')
-                if checklist_id:
-                    detailed = self.kaiten_client.get_checklist_details(kaiten_card_id, checklist_id)
-                    items = detailed.get('items', [])
-                else:
-                    items = checklist.get('items', [])
-
-                # Шаг 1: создать task-list в Planka
-                pl_task_list = self.planka_client.create_task_list(
-                    card_id=planka_card_id,
-                    name=checklist.get('name', 'Checklist')
-                )
-                if not pl_task_list or 'id' not in pl_task_list:
-                    logger.error(f"Failed to create task-list {checklist.get('name', 'Checklist')}")
-                    continue
-
-                tl_id = pl_task_list['id']
-                logger.info(f"Created task-list: {checklist.get('name', 'Checklist')}")
-
-                # Шаг 2: перенести элементы как tasks внутри списка
-                for idx, item in enumerate(items):
-                    name = item.get('text', '') or ''
-                    done = bool(item.get('checked', False))
-                    created = self.planka_client.create_task_in_list(
-                        task_list_id=tl_id,
-                        name=name,
-                        is_completed=done,
-                        position=idx * 65535  # разрядка позиций
-                    )
-                    if not created or 'id' not in created:
-                        logger.warning(f"Failed to create task item '{name}' in list {tl_id}")
+            # Чек-листы создаются по очереди; параллельно идут только их элементы
+            for idx, checklist in enumerate(kaiten_checklists):
+                self._migrate_checklist(kaiten_card_id, planka_card_id, idx, checklist)
         except Exception as e:
             logger.error(f"Error migrating checklists for card {kaiten_card_id}: {e}")
 
+    def _migrate_checklist(self, kaiten_card_id: int, planka_card_id: str, idx: int, checklist: Dict[str, Any]):
+        """Create a single Kaiten checklist as a Planka task-list together with its items."""
+        try:
+            # Детализация (для элементов)
+            checklist_id = checklist.get('id')
+            if checklist_id:
+                detailed = self.kaiten_client.get_checklist_details(kaiten_card_id, checklist_id)
+                items = detailed.get('items', [])
+            else:
+                items = checklist.get('items', [])
+
+            # Шаг 1: создать task-list в Planka
+            pl_task_list = self.planka_client.create_task_list(
+                card_id=planka_card_id,
+                name=checklist.get('name', 'Checklist'),
+                position=(idx + 1) * 65535
+            )
+            if not pl_task_list or 'id' not in pl_task_list:
+                logger.error(f"Failed to create task-list {checklist.get('name', 'Checklist')}")
+                return
+
+            tl_id = pl_task_list['id']
+            logger.info(f"Created task-list: {checklist.get('name', 'Checklist')}")
+
+            # Шаг 2: перенести элементы как tasks внутри списка.
+            # Элементы независимы, порядок сохраняется через position
+            list(self._item_executor.map(
+                lambda indexed_item: self._create_task_item(tl_id, *indexed_item),
+                enumerate(items)
+            ))
+        except Exception as e:
+            logger.error(f"Error migrating checklist {checklist.get('name', 'Checklist')} for card {kaiten_card_id}: {e}")
+
+    def _create_task_item(self, task_list_id: str, idx: int, item: Dict[str, Any]):
+        """Create a single checklist item as a task inside a Planka task-list."""
+        name = item.get('text', '') or ''
+        done = bool(item.get('checked', False))
+        created = self.planka_client.create_task_in_list(
+            task_list_id=task_list_id,
+            name=name,
+            is_completed=done,
+            position=idx * 65535  # разрядка позиций
+        )
+        if not created or 'id' not in created:
+            logger.warning(f"Failed to create task item '{name}' in list {task_list_id}")
+
+    def _download_attachment(self, attachment_url: str, attachment_name: str) -> Optional[str]:
+        """
+        Stream an attachment from Kaiten into a temporary file.
+
+        The size limit is enforced while reading, so it works even when the
+        server omits the content-length header. Returns the temporary file path,
+        or None if the download failed or the file is too large.
+        """
+        # Pooled session without credentials rather than a fresh connection per attachment
+        with self._download_session.get(attachment_url, stream=True, timeout=DOWNLOAD_TIMEOUT) as response:
+            if response.status_code != 200:
+                logger.error(f"Failed to download attachment {attachment_name}: HTTP {response.status_code}")
+                return None
+
+            written = 0
+            with tempfile.NamedTemporaryFile(delete=False) as tmp_file:
+                tmp_file_path = tmp_file.name
+                try:
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        written += len(chunk)
+                        if written > MAX_ATTACHMENT_SIZE:
+                            break
+                        tmp_file.write(chunk)
+                except Exception:
+                    # Don't leave a partial download behind (connection reset, disk full)
+                    tmp_file.close()
+                    os.unlink(tmp_file_path)
+                    raise
+
+        if written > MAX_ATTACHMENT_SIZE:
+            logger.warning(f"Skipping attachment {attachment_name} - file too large (more than {MAX_ATTACHMENT_SIZE} bytes)")
+            os.unlink(tmp_file_path)
+            return None
+        return tmp_file_path
+
     def migrate_attachments(self, kaiten_card_id: int, planka_card_id: str):
         """Migrate attachments from a Kaiten card to a Planka card."""
         try:
             kaiten_attachments = self.kaiten_client.get_attachments(kaiten_card_id)
             
-            for attachment in kaiten_attachments:
-                # Download attachment from Kaiten
-                attachment_url = attachment.get('url')
-                attachment_name = attachment.get('name', 'attachment')
-                
-                if attachment_url:
-                    # Create a temporary file to download the attachment
-                    import tempfile
-                    import os
-                    import requests
-                    
-                    try:
-                        response = requests.get(attachment_url)
-                        if response.status_code == 200:
-                            # Check content length if available
-                            content_length = response.headers.get('content-length')
-                            if content_length and int(content_length) > 10 * 1024 * 1024:  # 10MB
-                                logger.warning(f"Skipping attachment {attachment_name} - file too large ({int(content_length)} bytes)")
-                                continue
-                            
-                            # Create a temporary file
-                            with tempfile.NamedTemporaryFile(delete=False) as tmp_file:
-                                tmp_file.write(response.content)
-                                tmp_file_path = tmp_file.name
-                            
-                            # Check file size
-                            file_size = os.path.getsize(tmp_file_path)
-                            if file_size > 10 * 1024 * 1024:  # 10MB
-                                logger.warning(f"Skipping attachment {attachment_name} - file too large ({file_size} bytes)")
-                                os.unlink(tmp_file_path)
-                                continue
-                            
-                            # Upload to Planka
-                            result = self.planka_client.upload_attachment(
-                                card_id=planka_card_id,
-                                file_path=tmp_file_path,
-                                file_name=attachment_name
-                            )
-                            
-                            # Clean up temporary file
-                            os.unlink(tmp_file_path)
-                            
-                            if result and 'id' in result:
-                                logger.info(f"Uploaded attachment: {attachment_name}")
-                            else:
-                                logger.warning(f"Failed to upload attachment: {attachment_name}")
-                        else:
-                            logger.error(f"Failed to download attachment {attachment_name}: HTTP {response.status_code}")
-                    except Exception as e:
-                        logger.error(f"Error downloading/uploading attachment {attachment_name}: {e}")
-                else:
-                    logger.warning(f"Attachment {attachment_name} has no URL")
+            # Attachments are independent, so download/upload them concurrently
+            list(self._item_executor.map(
+                lambda attachment: self._migrate_attachment(attachment, planka_card_id),
+                kaiten_attachments
+            ))
         except Exception as e:
             logger.error(f"Error migrating attachments for card {kaiten_card_id}: {e}")
 
+    def _migrate_attachment(self, attachment: Dict[str, Any], planka_card_id: str):
+        """Download a single Kaiten attachment and upload it to a Planka card."""
+        # Download attachment from Kaiten
+        attachment_url = attachment.get('url')
+        attachment_name = attachment.get('name', 'attachment')
+        
+        if not attachment_url:
+            logger.warning(f"Attachment {attachment_name} has no URL")
+            return
+        
+        try:
+            tmp_file_path = self._download_attachment(attachment_url, attachment_name)
+            if not tmp_file_path:
+                return
+
+            try:
+                # Upload to Planka
+                result = self.planka_client.upload_attachment(
+                    card_id=planka_card_id,
+                    file_path=tmp_file_path,
+                    file_name=attachment_name
+                )
+            finally:
+                # Clean up temporary file
+                os.unlink(tmp_file_path)
+
+            if result and 'id' in result:
+                logger.info(f"Uploaded attachment: {attachment_name}")
+            else:
+                logger.warning(f"Failed to upload attachment: {attachment_name}")
+        except Exception as e:
+            logger.error(f"Error downloading/uploading attachment {attachment_name}: {e}")
+
     def migrate_comments(self, kaiten_card_id: int, planka_card_id: str):
         """Migrate comments from a Kaiten card to a Planka card."""
+        # Don't fetch comments and their authors just to drop them
+        if not self.planka_client.supports_comments:
+            return
         try:
             kaiten_comments = self.kaiten_client.get_card_comments(kaiten_card_id)
             
@@ -376,6 +456,9 @@ class KaitenToPlankaMigrator:
         
     def migrate_all(self):
         """Perform complete migration from Kaiten to Planka."""
+        if not self.planka_client.supports_comments:
+            logger.warning("Comment creation is not supported by the Planka client; card comments will be skipped.")
+
         # First, migrate all users
         self.migrate_users()
 
@@ -2,10 +2,6 @@
 Planka client package.
 """
 
-from .patcher import patch_plankapy
 from .client import PlankaClient
 
-# Apply patches when package is imported
-patch_plankapy()
-
 __all__ = ['PlankaClient']
\ No newline at end of file
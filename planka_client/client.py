@@ -2,31 +2,460 @@
 Planka API client for sending data.
 """
 
+import functools
+import io
 import logging
+import os
+import threading
+import time
+import types
+import uuid
 import requests
-from typing import Dict, Any, List, Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.fields import RequestField
+from urllib3.util.retry import Retry
+from typing import Dict, Any, List, Optional, Tuple
 from plankapy import Planka, TokenAuth
-from plankapy.models import Card_, Task_
+from .patcher import patch_plankapy
 
 logger = logging.getLogger(__name__)
 
+# plankapy is patched lazily, on the first PlankaClient instantiation
+_patched = False
+
+# Seconds after which the cached project/board/list/card indexes are rebuilt
+INDEX_TTL = 30.0
+
+# (connect, read) timeout in seconds for direct API requests
+REQUEST_TIMEOUT = (5, 30)
+
+# Worker threads for concurrent deletions (cards/lists and boards/projects respectively)
+EXECUTOR_WORKERS = 16
+DELETE_WORKERS = 4
+# Worker threads of the short-lived pool that walks one level of the index tree
+INDEX_WORKERS = 8
+
+# Seconds for which get_projects/get_boards/get_users/get_labels results are reused
+CACHE_TTL = 60.0
+
+# Status codes of successful create and delete requests
+_CREATED = frozenset((200, 201))
+_DELETED = frozenset((200, 204))
+
+# Error bodies are logged up to this many bytes (Planka's proxy may answer with whole HTML pages)
+MAX_ERROR_BODY = 512
+
+
+def _error_body(response: Optional[requests.Response]) -> str:
+    """Return the start of an error response body for logging."""
+    if response is None:
+        return 'No response'
+    return response.content[:MAX_ERROR_BODY].decode('utf-8', 'replace')
+
+
+def _ttl_cache(seconds: float = CACHE_TTL):
+    """
+    Memoize a PlankaClient read method per arguments for `seconds`.
+    
+    Empty results are not cached, since the methods also return [] on errors.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            key = (method.__name__,) + args + tuple(sorted(kwargs.items()))
+            cached = self._cache.get(key)
+            if cached is not None and time.monotonic() < cached[0]:
+                return list(cached[1])
+            result = method(self, *args, **kwargs)
+            if result:
+                self._cache[key] = (time.monotonic() + seconds, result)
+            return list(result)
+        return wrapper
+    return decorator
+
+
+class _MultipartFile:
+    """
+    multipart/form-data body that streams a file from disk.
+    
+    requests builds multipart bodies in memory; this object has a known length
+    and a read() method, so the file is sent in chunks with a Content-Length.
+    tell()/seek(0) let urllib3 rewind the body when it retries the request.
+    """
+
+    def __init__(self, field: str, file_name: str, fileobj, file_size: int, fields: Dict[str, str]):
+        boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+        
+        head = self._part_header(boundary, RequestField(name=field, data=b"", filename=file_name),
+                                 "application/octet-stream")
+        tail = b"\r\n"
+        for name, value in fields.items():
+            tail += self._part_header(boundary, RequestField(name=name, data=b""), "text/plain")
+            tail += value.encode("utf-8") + b"\r\n"
+        tail += f"--{boundary}--\r\n".encode()
+        
+        self._head = head
+        self._tail = tail
+        self._fileobj = fileobj
+        self._file_start = fileobj.tell()
+        self._length = len(head) + file_size + len(tail)
+        self.seek(0)
+
+    @staticmethod
+    def _part_header(boundary: str, field: RequestField, content_type: str) -> bytes:
+        field.make_multipart(content_type=content_type)
+        return f"--{boundary}\r\n".encode() + field.render_headers().encode("utf-8")
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self):
+        while True:
+            chunk = self.read(64 * 1024)
+            if not chunk:
+                return
+            yield chunk
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        """Rewind to the start of the body; other positions are not supported."""
+        if offset != 0 or whence != io.SEEK_SET:
+            raise io.UnsupportedOperation("multipart body can only be rewound to the start")
+        self._fileobj.seek(self._file_start)
+        self._parts = deque([io.BytesIO(self._head), self._fileobj, io.BytesIO(self._tail)])
+        self._position = 0
+        return 0
+
+    def read(self, size: int = -1) -> bytes:
+        chunks = []
+        while self._parts and size != 0:
+            chunk = self._parts[0].read(size)
+            if not chunk:
+                self._parts.popleft()
+                continue
+            chunks.append(chunk)
+            self._position += len(chunk)
+            if size > 0:
+                size -= len(chunk)
+        return b"".join(chunks)
+
+
+class _PlankaRetry(Retry):
+    """
+    urllib3 retry policy that also retries POST on HTTP 429.
+    
+    POST is otherwise not retried, since a 502/504 may arrive after Planka
+    already created the item; a 429 is rejected before any work is done.
+    """
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if method.upper() == "POST" and status_code == 429:
+            # Evaluate as an idempotent method so allowed_methods doesn't reject it
+            method = "GET"
+        return super().is_retry(method, status_code, has_retry_after)
+
 
 class PlankaClient:
+    """
+    Planka API client.
+    
+    Create one instance per program and reuse it: it owns the HTTP connection
+    pool, the worker threads and the id indexes.
+    """
+
     def __init__(self, api_url: str, api_key: str):
+        global _patched
+        if not _patched:
+            patch_plankapy()
+            _patched = True
+
         self.api_url = api_url.rstrip('/')
         # Ensure the API URL ends with /api for Planka
         if not self.api_url.endswith('/api'):
             self.api_url = f"{self.api_url}/api"
         self.api_key = api_key
-        # Initialize the plankapy client
-        self.client = Planka(self.api_url, TokenAuth(self.api_key))
 
+        # Shared session for direct API calls: keeps connections alive between requests
+        self._session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=50,
+            # Exponential backoff with jitter; Retry-After is honoured on 429/503
+            max_retries=_PlankaRetry(
+                total=5,
+                # Connection errors (DNS, refused) rarely recover within the backoff window
+                connect=2,
+                backoff_factor=1.0,
+                backoff_jitter=0.5,
+                status_forcelist=[429, 502, 503, 504],
+                allowed_methods=frozenset(["GET", "DELETE", "PATCH"]),
+                respect_retry_after_header=True
+            )
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+        self._session.headers.update({
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        })
+
+        # id -> JSON item indexes, built lazily by _refresh_indexes()
+        self._project_index: Dict[str, Any] = {}
+        self._board_index: Dict[str, Any] = {}
+        self._list_index: Dict[str, Any] = {}
+        self._card_index: Dict[str, Any] = {}
+        # Parent pointers: board -> project, list -> board, card -> list
+        self._board_parent: Dict[str, str] = {}
+        self._list_parent: Dict[str, str] = {}
+        self._card_parent: Dict[str, str] = {}
+        self._indexes_built_at: Optional[float] = None
+        # Project objects from the last GET /projects, see _projects_iter()
+        self._projects_snapshot: Optional[List[Any]] = None
+        self._projects_fetched_at: Optional[float] = None
+        # (method name, *args) -> (expiry, result), filled by @_ttl_cache
+        self._cache: Dict[tuple, tuple] = {}
+        # board id -> (fetched at, lists) prefetched by get_boards(prefetch_lists=True), used for INDEX_TTL
+        self._board_lists: Dict[str, Tuple[float, List[Dict[str, Any]]]] = {}
+        # Deletions run in worker threads, so index mutations are serialized. The lock is
+        # only held for dict updates, never across HTTP requests
+        self._index_lock = threading.RLock()
+        # Serialize the tree walks, so concurrent misses share one walk
+        self._walk_lock = threading.Lock()
+
+        # Pool for independent leaf requests (card/list deletions)
+        self._executor = ThreadPoolExecutor(max_workers=EXECUTOR_WORKERS)
+        
+        # create_comment() is a stub; callers check this before building comments
+        self.supports_comments = False
+        self._comment_warned = False
+
+    @functools.cached_property
+    def client(self) -> Planka:
+        """plankapy client, created on first use; the direct API paths never need it."""
+        return Planka(self.api_url, TokenAuth(self.api_key))
+
+    @property
+    def session(self) -> requests.Session:
+        """Pooled session with the auth and JSON headers set, for scripts calling the API directly."""
+        return self._session
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and worker pool."""
+        self._executor.shutdown(wait=True)
+        self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _refresh_indexes(self) -> None:
+        """
+        Walk the project -> board -> list -> card tree once and index every object by id.
+        
+        The tree is read from the JSON API: GET /projects includes the boards and
+        GET /boards/{id} includes the lists and cards. plankapy is not used, as its
+        models share one request handler and are not safe to call from several threads.
+        The walk is reused until INDEX_TTL expires or a lookup misses; the boards are
+        fetched concurrently into new dicts, which are swapped in afterwards, so
+        lookups are never blocked behind the HTTP walk.
+        """
+        requested_at = time.monotonic()
+        with self._walk_lock:
+            # Another thread started a walk after this one was requested, so its result is current
+            if self._indexes_built_at is not None and self._indexes_built_at >= requested_at:
+                return
+            started_at = time.monotonic()
+            
+            data = self._api_get("/projects")
+            boards = data.get('included', {}).get('boards', [])
+            project_index = {project['id']: project for project in data.get('items', [])}
+            board_index = {board['id']: board for board in boards}
+            board_parent = {board['id']: board.get('projectId') for board in boards}
+            
+            list_index: Dict[str, Any] = {}
+            list_parent: Dict[str, str] = {}
+            card_index: Dict[str, Any] = {}
+            card_parent: Dict[str, str] = {}
+            # The walk uses its own short-lived pool rather than self._executor, so it never
+            # competes with in-flight creates and deletes for worker slots (or waits on them)
+            with ThreadPoolExecutor(max_workers=INDEX_WORKERS) as walk_pool:
+                fetched = list(walk_pool.map(self._fetch_board_contents, board_index))
+            for board_id, included in zip(board_index, fetched):
+                for lst in included.get('lists', []):
+                    list_index[lst['id']] = lst
+                    list_parent[lst['id']] = board_id
+                for card in included.get('cards', []):
+                    card_index[card['id']] = card
+                    card_parent[card['id']] = card.get('listId')
+            
+            with self._index_lock:
+                self._replace(self._project_index, project_index)
+                self._replace(self._board_index, board_index)
+                self._replace(self._board_parent, board_parent)
+                self._replace(self._list_index, list_index)
+                self._replace(self._list_parent, list_parent)
+                self._replace(self._card_index, card_index)
+                self._replace(self._card_parent, card_parent)
+                self._board_lists.clear()
+                self._indexes_built_at = started_at
+
+    @staticmethod
+    def _replace(index: Dict[str, Any], new: Dict[str, Any]) -> None:
+        """Make index equal to new in place, without it ever being empty in between."""
+        for key in index.keys() - new.keys():
+            del index[key]
+        index.update(new)
+
+    def _projects_iter(self, force_refresh: bool = False) -> List[Any]:
+        """
+        Return the plankapy project objects, reusing the last fetch for up to INDEX_TTL.
+        
+        Args:
+            force_refresh: Fetch the projects from Planka even if the snapshot is fresh
+        """
+        with self._index_lock:
+            stale = (self._projects_fetched_at is None
+                     or time.monotonic() - self._projects_fetched_at > INDEX_TTL)
+            if not (force_refresh or self._projects_snapshot is None or stale):
+                return list(self._projects_snapshot)
+        projects = list(self.client.projects)
+        with self._index_lock:
+            self._projects_snapshot = projects
+            self._projects_fetched_at = time.monotonic()
+        return list(projects)
+
+    def _fetch_board_contents(self, board_id: str) -> Dict[str, Any]:
+        """Read the 'included' lists and cards of a board for the index walk, returning {} on failure."""
+        try:
+            board_data = self._get_board_data(board_id)
+            return board_data.get('included', {}) if board_data else {}
+        except Exception as e:
+            logger.debug("Could not get contents of board %s: %s", board_id, e)
+            return {}
+
+    def _indexes_stale(self) -> bool:
+        """Check whether the indexes were never built or are older than INDEX_TTL."""
+        return self._indexes_built_at is None or time.monotonic() - self._indexes_built_at > INDEX_TTL
+
+    def _lookup(self, index: Dict[str, Any], obj_id: str) -> Optional[Any]:
+        """
+        Find an object in one of the indexes, rebuilding them if stale or on a miss.
+        """
+        if not self._indexes_stale():
+            obj = index.get(obj_id)
+            if obj is not None:
+                return obj
+        self._refresh_indexes()
+        return index.get(obj_id)
+
+    def invalidate_indexes(self) -> None:
+        """Mark the id indexes as stale so the next lookup rebuilds them."""
+        with self._index_lock:
+            self._indexes_built_at = None
+
+    def invalidate_cache(self) -> None:
+        """
+        Forget all cached get_projects/get_boards/get_users/get_labels results and prefetched lists.
+        
+        Call this after changing boards or lists through self.session directly.
+        """
+        self._cache.clear()
+        with self._index_lock:
+            self._board_lists.clear()
+
+    def _invalidate(self, name: str, *args) -> None:
+        """Drop cached results of a @_ttl_cache method, optionally only for the given arguments."""
+        for key in list(self._cache):
+            if key[0] == name and (not args or key[1:] == args):
+                self._cache.pop(key, None)
+
+    def _forget_card(self, card_id: str) -> None:
+        """Drop a deleted card from the indexes."""
+        with self._index_lock:
+            self._card_index.pop(card_id, None)
+            self._card_parent.pop(card_id, None)
+
+    def _forget_list(self, list_id: str) -> None:
+        """Drop a deleted list and its cards from the indexes."""
+        with self._index_lock:
+            for card_id in [c for c, parent in self._card_parent.items() if parent == list_id]:
+                self._forget_card(card_id)
+            self._list_index.pop(list_id, None)
+            board_id = self._list_parent.pop(list_id, None)
+            self._board_lists.pop(board_id, None)
+
+    def _forget_board(self, board_id: str) -> None:
+        """Drop a deleted board and its lists from the indexes."""
+        with self._index_lock:
+            for list_id in [lst for lst, parent in self._list_parent.items() if parent == board_id]:
+                self._forget_list(list_id)
+            self._board_index.pop(board_id, None)
+            self._board_parent.pop(board_id, None)
+            self._board_lists.pop(board_id, None)
+        self._invalidate("get_labels", board_id)
+        self._invalidate("get_boards")
+
+    def _forget_project(self, project_id: str) -> None:
+        """Drop a deleted project and its boards from the indexes."""
+        with self._index_lock:
+            for board_id in [b for b, parent in self._board_parent.items() if parent == project_id]:
+                self._forget_board(board_id)
+            self._project_index.pop(project_id, None)
+            self._projects_snapshot = None
+        self._invalidate("get_projects")
+        self._invalidate("get_boards")
+
+    def _api_get(self, path: str) -> Dict[str, Any]:
+        """GET a Planka API path and return the decoded JSON body."""
+        response = self._session.get(f"{self.api_url}{path}", timeout=REQUEST_TIMEOUT)
+        response.raise_for_status()
+        return response.json()
+
+    def _get_board_data(self, board_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetch a board with its lists, cards and labels in one request.
+        
+        Returns None if the board doesn't exist.
+        """
+        try:
+            return self._api_get(f"/boards/{board_id}")
+        except requests.exceptions.HTTPError as e:
+            if e.response is not None and e.response.status_code == 404:
+                return None
+            raise
+
+    @staticmethod
+    def _lists_of(board_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Extract the lists from a GET /boards/{id} response."""
+        lists = board_data.get('included', {}).get('lists', [])
+        return [{'id': lst.get('id'), 'name': lst.get('name')} for lst in lists]
+
+    def _post_json(self, url: str, data: Dict[str, Any], what: str) -> Optional[Dict[str, Any]]:
+        """
+        POST a JSON payload and return the created 'item'.
+        
+        Returns None (after logging) if Planka answers with anything but 200/201.
+        """
+        response = self._session.post(url, json=data, timeout=REQUEST_TIMEOUT)
+        if response.status_code in _CREATED:
+            return response.json().get('item', {})
+        logger.error(f"Error creating {what}: HTTP {response.status_code} - {_error_body(response)}")
+        return None
+
+    @_ttl_cache()
     def get_projects(self) -> List[Dict[str, Any]]:
         """Get all projects from Planka."""
         try:
-            projects = self.client.projects
-            # Convert plankapy Project objects to dictionaries
-            return [{'id': p.id, 'name': p.name} for p in projects]
+            # Read the JSON API directly: plankapy fetches again on every attribute access
+            projects = self._api_get("/projects").get('items', [])
+            return [{'id': p.get('id'), 'name': p.get('name')} for p in projects]
         except Exception as e:
             logger.error(f"Error getting projects: {e}")
             return []
@@ -37,50 +466,62 @@ class PlankaClient:
             # Use direct HTTP request instead of plankapy's create_project method
             # which has compatibility issues
             url = f"{self.api_url}/projects"
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
             data = {
                 "name": name,
                 "type": type
             }
             
-            response = requests.post(url, headers=headers, json=data)
-            if response.status_code in [200, 201]:
-                result = response.json()
-                project_data = result.get('item', {})
-                return {
-                    'id': project_data.get('id'),
-                    'name': project_data.get('name')
-                }
-            else:
-                logger.error(f"Error creating project: HTTP {response.status_code} - {response.text}")
+            project_data = self._post_json(url, data, "project")
+            if project_data is None:
                 return {}
+            with self._index_lock:
+                self._projects_snapshot = None
+            self._invalidate("get_projects")
+            return {
+                'id': project_data.get('id'),
+                'name': project_data.get('name')
+            }
         except Exception as e:
             logger.error(f"Error creating project: {e}")
             return {}
 
-    def get_boards(self) -> List[Dict[str, Any]]:
-        """Get all boards from Planka."""
+    def _fetch_board_lists(self, board_id: str) -> Optional[List[Dict[str, Any]]]:
+        """Fetch the lists of a board, returning None on failure."""
+        try:
+            board_data = self._get_board_data(board_id)
+            return self._lists_of(board_data) if board_data is not None else None
+        except Exception as e:
+            logger.debug("Could not get lists for board %s: %s", board_id, e)
+            return None
+
+    @_ttl_cache()
+    def get_boards(self, prefetch_lists: bool = False) -> List[Dict[str, Any]]:
+        """
+        Get all boards from Planka.
+        
+        GET /projects already includes every board, so a single request is enough.
+        
+        Args:
+            prefetch_lists: Also fetch the lists of every board (concurrently) so
+                that subsequent get_lists() calls need no HTTP request
+        """
         try:
-            # Get all projects first
-            projects = self.client.projects
-            all_boards = []
+            boards = self._api_get("/projects").get('included', {}).get('boards', [])
+            all_boards = [
+                {'id': board.get('id'), 'name': board.get('name'), 'projectId': board.get('projectId')}
+                for board in boards
+            ]
+            with self._index_lock:
+                for board in all_boards:
+                    self._board_parent[board['id']] = board['projectId']
             
-            # For each project, get its boards
-            for project in projects:
-                try:
-                    boards = project.boards
-                    for board in boards:
-                        all_boards.append({
-                            'id': board.id,
-                            'name': board.name,
-                            'projectId': project.id
-                        })
-                except Exception as e:
-                    logger.debug(f"Could not get boards for project {project.id}: {e}")
-                    # Continue with other projects even if one fails
+            if prefetch_lists:
+                board_ids = [board['id'] for board in all_boards]
+                fetched_at = time.monotonic()
+                for board_id, lists in zip(board_ids, self._executor.map(self._fetch_board_lists, board_ids)):
+                    if lists is not None:
+                        with self._index_lock:
+                            self._board_lists[board_id] = (fetched_at, lists)
             
             logger.info(f"Total boards found across all projects: {len(all_boards)}")
             return all_boards
@@ -94,26 +535,23 @@ class PlankaClient:
             # Use direct HTTP request instead of plankapy's create_board method
             # which has compatibility issues
             url = f"{self.api_url}/projects/{project_id}/boards"
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
             data = {
                 "name": name,
                 "position": position
             }
             
-            response = requests.post(url, headers=headers, json=data)
-            if response.status_code in [200, 201]:
-                result = response.json()
-                board_data = result.get('item', {})
-                return {
-                    'id': board_data.get('id'),
-                    'name': board_data.get('name')
-                }
-            else:
-                logger.error(f"Error creating board: HTTP {response.status_code} - {response.text}")
+            board_data = self._post_json(url, data, "board")
+            if board_data is None:
                 return {}
+            if board_data.get('id'):
+                # Record the parent so deleting the project also forgets this board
+                with self._index_lock:
+                    self._board_parent[board_data['id']] = project_id
+            self._invalidate("get_boards")
+            return {
+                'id': board_data.get('id'),
+                'name': board_data.get('name')
+            }
         except Exception as e:
             logger.error(f"Error creating board: {e}")
             return {}
@@ -121,26 +559,21 @@ class PlankaClient:
     def get_lists(self, board_id: str) -> List[Dict[str, Any]]:
         """Get all lists for a board from Planka."""
         try:
-            # Find the board across all projects
-            board_obj = None
-            for project in self.client.projects:
-                try:
-                    for board in project.boards:
-                        if board.id == board_id:
-                            board_obj = board
-                            break
-                except Exception as e:
-                    logger.debug(f"Could not get boards for project {project.id}: {e}")
-                if board_obj:
-                    break
-            
-            if not board_obj:
-                logger.error(f"Board {board_id} not found")
-                return []
+            # Use the lists prefetched by get_boards(prefetch_lists=True), if any and still fresh
+            prefetched = self._board_lists.get(board_id)
+            lists = None
+            if prefetched is not None and time.monotonic() - prefetched[0] <= INDEX_TTL:
+                lists = prefetched[1]
             
-            # Get lists for the board
-            lists = board_obj.lists
-            return [{'id': lst.id, 'name': lst.name} for lst in lists]
+            if lists is None:
+                board_data = self._get_board_data(board_id)
+                
+                if board_data is None:
+                    logger.error(f"Board {board_id} not found")
+                    return []
+                
+                lists = self._lists_of(board_data)
+            return list(lists)
         except Exception as e:
             logger.error(f"Error getting lists for board {board_id}: {e}")
             return []
@@ -151,27 +584,21 @@ class PlankaClient:
             # Use direct HTTP request instead of plankapy's create_list method
             # which has compatibility issues
             url = f"{self.api_url}/boards/{board_id}/lists"
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
             data = {
                 "name": name,
                 "position": position,
                 "type": type
             }
             
-            response = requests.post(url, headers=headers, json=data)
-            if response.status_code in [200, 201]:
-                result = response.json()
-                list_data = result.get('item', {})
-                return {
-                    'id': list_data.get('id'),
-                    'name': list_data.get('name')
-                }
-            else:
-                logger.error(f"Error creating list: HTTP {response.status_code} - {response.text}")
+            list_data = self._post_json(url, data, "list")
+            if list_data is None:
                 return {}
+            with self._index_lock:
+                self._board_lists.pop(board_id, None)
+            return {
+                'id': list_data.get('id'),
+                'name': list_data.get('name')
+            }
         except Exception as e:
             logger.error(f"Error creating list: {e}")
             return {}
@@ -179,29 +606,19 @@ class PlankaClient:
     def get_cards(self, list_id: str) -> List[Dict[str, Any]]:
         """Get all cards for a list from Planka."""
         try:
-            # Find the list across all boards and projects
-            list_obj = None
-            for project in self.client.projects:
-                try:
-                    for board in project.boards:
-                        for lst in board.lists:
-                            if lst.id == list_id:
-                                list_obj = lst
-                                break
-                        if list_obj:
-                            break
-                except Exception as e:
-                    logger.debug(f"Could not get boards/lists for project {project.id}: {e}")
-                if list_obj:
-                    break
+            # Find the list's board using the cached index
+            list_item = self._lookup(self._list_index, list_id)
             
-            if not list_obj:
+            if not list_item:
                 logger.error(f"List {list_id} not found")
                 return []
             
-            # Get cards for the list
-            cards = list_obj.cards
-            return [{'id': card.id, 'name': card.name} for card in cards]
+            # Get cards for the list; GET /boards/{id} includes the cards of every list
+            board_data = self._get_board_data(self._list_parent.get(list_id))
+            if board_data is None:
+                return []
+            cards = board_data.get('included', {}).get('cards', [])
+            return [{'id': card.get('id'), 'name': card.get('name')} for card in cards if card.get('listId') == list_id]
         except Exception as e:
             logger.error(f"Error getting cards for list {list_id}: {e}")
             return []
@@ -212,10 +629,6 @@ class PlankaClient:
             # Use direct HTTP request instead of plankapy's create_card method
             # which has compatibility issues
             url = f"{self.api_url}/lists/{list_id}/cards"
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
             data = {
                 "name": name,
                 "description": description if description else " ",  # Use space instead of empty string
@@ -223,17 +636,13 @@ class PlankaClient:
                 "type": type
             }
             
-            response = requests.post(url, headers=headers, json=data)
-            if response.status_code in [200, 201]:
-                result = response.json()
-                card_data = result.get('item', {})
-                return {
-                    'id': card_data.get('id'),
-                    'name': card_data.get('name')
-                }
-            else:
-                logger.error(f"Error creating card: HTTP {response.status_code} - {response.text}")
+            card_data = self._post_json(url, data, "card")
+            if card_data is None:
                 return {}
+            return {
+                'id': card_data.get('id'),
+                'name': card_data.get('name')
+            }
         except Exception as e:
             logger.error(f"Error creating card: {e}")
             return {}
@@ -242,25 +651,17 @@ class PlankaClient:
         """Create a new checklist (task) in Planka."""
         try:
             url = f"{self.api_url}/cards/{card_id}/tasks"
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
             data = {
                 "name": name
             }
             
-            response = requests.post(url, headers=headers, json=data)
-            if response.status_code in [200, 201]:
-                result = response.json()
-                checklist_data = result.get('item', {})
-                return {
-                    'id': checklist_data.get('id'),
-                    'name': checklist_data.get('name')
-                }
-            else:
-                logger.error(f"Error creating checklist: HTTP {response.status_code} - {response.text}")
+            checklist_data = self._post_json(url, data, "checklist")
+            if checklist_data is None:
                 return {}
+            return {
+                'id': checklist_data.get('id'),
+                'name': checklist_data.get('name')
+            }
         except Exception as e:
             logger.error(f"Error creating checklist: {e}")
             return {}
@@ -269,27 +670,19 @@ class PlankaClient:
         """Create a new item in a checklist (task-item) in Planka."""
         try:
             url = f"{self.api_url}/tasks/{task_id}/task-items"
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
             data = {
                 "name": name,
                 "isCompleted": is_completed
             }
             
-            response = requests.post(url, headers=headers, json=data)
-            if response.status_code in [200, 201]:
-                result = response.json()
-                item_data = result.get('item', {})
-                return {
-                    'id': item_data.get('id'),
-                    'name': item_data.get('name'),
-                    'isCompleted': item_data.get('isCompleted', False)
-                }
-            else:
-                logger.error(f"Error creating checklist item: HTTP {response.status_code} - {response.text}")
+            item_data = self._post_json(url, data, "checklist item")
+            if item_data is None:
                 return {}
+            return {
+                'id': item_data.get('id'),
+                'name': item_data.get('name'),
+                'isCompleted': item_data.get('isCompleted', False)
+            }
         except Exception as e:
             logger.error(f"Error creating checklist item: {e}")
             return {}
@@ -298,34 +691,29 @@ class PlankaClient:
         """Upload an attachment to a card in Planka."""
         try:
             url = f"{self.api_url}/cards/{card_id}/attachments"
-            headers = {
-                "Authorization": f"Bearer {self.api_key}"
-            }
-            
             # If file_name is not provided, use the basename of file_path
             if not file_name:
-                import os
                 file_name = os.path.basename(file_path)
             
-            # Check file size (Planka has limits)
-            import os
-            file_size = os.path.getsize(file_path)
+            # Check file size (Planka has limits) before opening the file
+            file_size = os.stat(file_path).st_size
             max_size = 10 * 1024 * 1024  # 10MB
             
             if file_size > max_size:
                 logger.warning(f"File {file_name} is too large ({file_size} bytes). Skipping upload.")
                 return {}
             
-            # Try with "file" field name instead of "attachment"
             with open(file_path, 'rb') as f:
-                files = {
-                    'file': (file_name, f, 'application/octet-stream'),
-                    'name': (None, file_name, 'text/plain'),
-                    'type': (None, 'file', 'text/plain')
-                }
-                response = requests.post(url, headers=headers, files=files)
+                # Try with "file" field name instead of "attachment"; the body is streamed from disk
+                body = _MultipartFile('file', file_name, f, file_size, {'name': file_name, 'type': 'file'})
+                response = self._session.post(
+                    url,
+                    data=body,
+                    headers={"Content-Type": body.content_type},
+                    timeout=REQUEST_TIMEOUT
+                )
                 
-            if response.status_code in [200, 201]:
+            if response.status_code in _CREATED:
                 result = response.json()
                 attachment_data = result.get('item', {})
                 return {
@@ -333,17 +721,21 @@ class PlankaClient:
                     'name': attachment_data.get('name')
                 }
             else:
-                logger.error(f"Error uploading attachment: HTTP {response.status_code} - {response.text}")
+                logger.error(f"Error uploading attachment: HTTP {response.status_code} - {_error_body(response)}")
                 return {}
         except Exception as e:
             logger.error(f"Error uploading attachment: {e}")
             return {}
 
+    @_ttl_cache()
     def get_users(self) -> List[Dict[str, Any]]:
         """Get all users from Planka."""
         try:
-            users = self.client.users
-            return [{'id': u.id, 'name': u.name, 'username': u.username} for u in users]
+            users = self._api_get("/users").get('items', [])
+            return [
+                {'id': u.get('id'), 'name': u.get('name'), 'username': u.get('username'), 'email': u.get('email')}
+                for u in users
+            ]
         except Exception as e:
             logger.error(f"Error getting users: {e}")
             return []
@@ -352,34 +744,24 @@ class PlankaClient:
         """Create a new user in Planka."""
         try:
             user = self.client.create_user(username=username, email=email, password=password, name=name)
+            self._invalidate("get_users")
             return {'id': user.id, 'name': user.name, 'username': user.username}
         except Exception as e:
             logger.error(f"Error creating user: {e}")
             return {}
 
+    @_ttl_cache()
     def get_labels(self, board_id: str) -> List[Dict[str, Any]]:
         """Get all labels for a board from Planka."""
         try:
-            # Find the board across all projects
-            board_obj = None
-            for project in self.client.projects:
-                try:
-                    for board in project.boards:
-                        if board.id == board_id:
-                            board_obj = board
-                            break
-                except Exception as e:
-                    logger.debug(f"Could not get boards for project {project.id}: {e}")
-                if board_obj:
-                    break
+            board_data = self._get_board_data(board_id)
             
-            if not board_obj:
+            if board_data is None:
                 logger.error(f"Board {board_id} not found")
                 return []
             
-            # Get labels for the board
-            labels = board_obj.labels
-            return [{'id': label.id, 'name': label.name, 'color': label.color} for label in labels]
+            labels = board_data.get('included', {}).get('labels', [])
+            return [{'id': label.get('id'), 'name': label.get('name'), 'color': label.get('color')} for label in labels]
         except Exception as e:
             logger.error(f"Error getting labels for board {board_id}: {e}")
             return []
@@ -389,250 +771,197 @@ class PlankaClient:
         try:
             # Use direct HTTP request to create the label
             url = f"{self.api_url}/boards/{board_id}/labels"
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
             data = {
                 "name": name,
                 "color": color
             }
             
-            response = requests.post(url, headers=headers, json=data)
-            if response.status_code in [200, 201]:
-                result = response.json()
-                label_data = result.get('item', {})
-                return {
-                    'id': label_data.get('id'),
-                    'name': label_data.get('name'),
-                    'color': label_data.get('color')
-                }
-            else:
-                logger.error(f"Error creating label: HTTP {response.status_code} - {response.text}")
+            label_data = self._post_json(url, data, "label")
+            if label_data is None:
                 return {}
+            self._invalidate("get_labels", board_id)
+            return {
+                'id': label_data.get('id'),
+                'name': label_data.get('name'),
+                'color': label_data.get('color')
+            }
         except Exception as e:
             logger.error(f"Error creating label: {e}")
             return {}
 
     def add_label_to_card(self, card_id: str, label_id: str) -> Dict[str, Any]:
-        """Add a label to a card in Planka using plankapy."""
+        """Add a label to a card in Planka."""
         try:
-            # Find the card using plankapy
-            card = self._get_card_by_id(card_id)
-            if not card:
-                logger.error(f"Card with id {card_id} not found")
-                return {}
+            # A single POST by id: resolving the card and label as plankapy objects
+            # first would cost a tree walk and a labels GET per call
+            url = f"{self.api_url}/cards/{card_id}/card-labels"
+            data = {"labelId": label_id}
             
-            # Find the label across all boards
-            label_obj = None
-            for project in self.client.projects:
-                try:
-                    for board in project.boards:
-                        for label in board.labels:
-                            if label.id == label_id:
-                                label_obj = label
-                                break
-                        if label_obj:
-                            break
-                except Exception as e:
-                    logger.debug(f"Could not get labels for project {project.id}: {e}")
-                if label_obj:
-                    break
-            
-            if not label_obj:
-                logger.error(f"Label {label_id} not found")
-                return {}
-            
-            # Add label to card using plankapy method
-            card_label = card.add_label(label_obj)
-            
-            # Refresh card to get updated labels
-            card.refresh()
-            
-            # Verify the label was added
-            if card_label and hasattr(card_label, 'id'):
-                return {"id": card_label.id}
-            else:
-                logger.warning("Label added but no card label ID returned")
+            card_label_data = self._post_json(url, data, "card label")
+            if card_label_data is None:
                 return {}
+            return {
+                'id': card_label_data.get('id'),
+                'labelId': card_label_data.get('labelId')
+            }
         except Exception as e:
-            logger.error(f"Error adding label to card using plankapy: {e}")
-            # Fallback to direct API call if plankapy method fails
-            try:
-                url = f"{self.api_url}/cards/{card_id}/card-labels"
-                headers = {
-                    "Authorization": f"Bearer {self.api_key}",
-                    "Content-Type": "application/json"
-                }
-                data = {"labelId": label_id}
-                
-                response = requests.post(url, headers=headers, json=data)
-                if response.status_code in [200, 201]:
-                    result = response.json()
-                    card_label_data = result.get('item', {})
-                    return {
-                        'id': card_label_data.get('id'),
-                        'labelId': card_label_data.get('labelId')
-                    }
-                else:
-                    logger.error(f"Error adding label to card via API: HTTP {response.status_code} - {response.text}")
-                    return {}
-            except Exception as api_e:
-                logger.error(f"Error adding label to card via API fallback: {api_e}")
-                return {}
+            logger.error(f"Error adding label to card: {e}")
+            return {}
 
     def delete_board(self, board_id: str) -> bool:
         """Delete a board from Planka."""
         try:
-            logger.debug(f"Attempting to delete board {board_id}")
+            logger.debug("Attempting to delete board %s", board_id)
             
-            # Find the board across all projects
-            board_obj = None
-            for project in self.client.projects:
-                try:
-                    for board in project.boards:
-                        if board.id == board_id:
-                            board_obj = board
-                            break
-                except Exception as e:
-                    logger.debug(f"Could not get boards for project {project.id}: {e}")
-                if board_obj:
-                    break
+            # Find the board using the cached index
+            board = self._lookup(self._board_index, board_id)
             
-            if not board_obj:
+            if not board:
                 logger.warning(f"Board {board_id} not found (already deleted)")
                 return True
             
-            # Delete the board
-            board_obj.delete()
-            logger.debug(f"Successfully deleted board {board_id}")
+            # Delete the board by id; the index holds JSON items, not plankapy objects
+            response = self._session.delete(f"{self.api_url}/boards/{board_id}", timeout=REQUEST_TIMEOUT)
+            response.raise_for_status()
+            self._forget_board(board_id)
+            logger.debug("Successfully deleted board %s", board_id)
             return True
         except Exception as e:
             logger.error(f"Error deleting board {board_id}: {e}")
             return False
 
-    def delete_board_with_contents(self, board_id: str) -> bool:
+    def _delete_card_safe(self, card_id: str) -> bool:
+        """Delete a single card by id, logging instead of raising on failure."""
+        try:
+            response = self._session.delete(f"{self.api_url}/cards/{card_id}", timeout=REQUEST_TIMEOUT)
+        except Exception as e:
+            logger.error(f"Error deleting card {card_id}: {e}")
+            return False
+        if response.status_code in _DELETED:
+            self._forget_card(card_id)
+            logger.debug("Deleted card %s", card_id)
+            return True
+        elif response.status_code == 404:
+            self._forget_card(card_id)
+            logger.warning(f"Card {card_id} not found (already deleted)")
+            return True
+        logger.error(f"Error deleting card {card_id}: HTTP {response.status_code} - {_error_body(response)}")
+        return False
+
+    def _delete_list_safe(self, list_id: str) -> bool:
+        """Delete a single list by id, logging instead of raising on failure."""
+        try:
+            response = self._session.delete(f"{self.api_url}/lists/{list_id}", timeout=REQUEST_TIMEOUT)
+        except Exception as e:
+            logger.error(f"Error deleting list {list_id}: {e}")
+            return False
+        if response.status_code in _DELETED:
+            self._forget_list(list_id)
+            logger.debug("Deleted list %s", list_id)
+            return True
+        elif response.status_code == 404:
+            self._forget_list(list_id)
+            logger.warning(f"List {list_id} not found (already deleted)")
+            return True
+        elif response.status_code == 403:
+            logger.warning(f"Forbidden to delete list {list_id}. May already be deleted or insufficient permissions. Continuing...")
+            return True
+        logger.error(f"Error deleting list {list_id}: HTTP {response.status_code} - {_error_body(response)}")
+        return False
+
+    def _delete_board_cascade(self, board_id: str) -> bool:
+        """Delete a board with a single request; Planka removes its lists and cards server-side."""
+        url = f"{self.api_url}/boards/{board_id}"
+        response = self._session.delete(url, timeout=REQUEST_TIMEOUT)
+        if response.status_code in _DELETED:
+            self._forget_board(board_id)
+            logger.debug("Successfully deleted board %s with all contents", board_id)
+            return True
+        elif response.status_code == 404:
+            self._forget_board(board_id)
+            logger.warning(f"Board {board_id} not found (already deleted)")
+            return True
+        else:
+            logger.error(f"Error deleting board {board_id}: HTTP {response.status_code} - {_error_body(response)}")
+            return False
+
+    def delete_board_with_contents(self, board_id: str, cascade: bool = True) -> bool:
         """
         Delete a board and all its contents (lists and cards).
         
         Args:
             board_id (str): The ID of the board to delete
+            cascade (bool): Rely on Planka's server-side cascade and send a single
+                DELETE for the board. When False, cards and lists are deleted
+                one by one before the board.
             
         Returns:
             bool: True if successful, False otherwise
         """
         try:
-            logger.debug(f"Attempting to delete board {board_id} with all contents")
+            if cascade:
+                return self._delete_board_cascade(board_id)
             
-            # Find the board across all projects
-            board_obj = None
-            for project in self.client.projects:
-                try:
-                    for board in project.boards:
-                        if board.id == board_id:
-                            board_obj = board
-                            break
-                except Exception as e:
-                    logger.debug(f"Could not get boards for project {project.id}: {e}")
-                if board_obj:
-                    break
+            logger.debug("Attempting to delete board %s with all contents", board_id)
             
-            if not board_obj:
+            # 1) Get the lists and cards of this board; GET /boards/{id} includes both
+            board_data = self._get_board_data(board_id)
+            if board_data is None:
+                self._forget_board(board_id)
                 logger.warning(f"Board {board_id} not found (already deleted)")
                 return True
+            included = board_data.get('included', {})
+            list_ids = [lst['id'] for lst in included.get('lists', [])]
+            card_ids = [card['id'] for card in included.get('cards', [])]
+            logger.debug("Found %s lists and %s cards in board %s", len(list_ids), len(card_ids), board_id)
             
-            # 1) Get all lists for this board
-            lists = board_obj.lists
-            logger.debug(f"Found {len(lists)} lists in board {board_id}")
-            
-            # 2) For each list - get cards and delete them
-            for lst in lists:
-                list_id = lst.id
-                
-                # Get all cards in this list
-                cards = lst.cards
-                logger.debug(f"Found {len(cards)} cards in list {list_id}")
-                
-                # Delete each card
-                for card in cards:
-                    card_id = card.id
-                    try:
-                        card.delete()
-                        logger.debug(f"Deleted card {card_id}")
-                    except requests.exceptions.HTTPError as e:
-                        if e.response.status_code == 404:
-                            logger.warning(f"Card {card_id} not found (already deleted)")
-                        else:
-                            logger.error(f"Error deleting card {card_id}: {e}")
-                            logger.error(f"Response body: {e.response.text if e.response else 'No response'}")
-                            # Continue with other cards even if one fails
-                    except Exception as e:
-                        logger.error(f"Error deleting card {card_id}: {e}")
-                        # Continue with other cards even if one fails
-                
-                # Delete the list itself
-                try:
-                    lst.delete()
-                    logger.debug(f"Deleted list {list_id}")
-                except requests.exceptions.HTTPError as e:
-                    if e.response.status_code == 404:
-                        logger.warning(f"List {list_id} not found (already deleted)")
-                    elif e.response.status_code == 403:
-                        logger.warning(f"Forbidden to delete list {list_id}. May already be deleted or insufficient permissions. Continuing...")
-                    else:
-                        logger.error(f"Error deleting list {list_id}: {e}")
-                        logger.error(f"Response body: {e.response.text if e.response else 'No response'}")
-                        # Continue with other lists even if one fails
-                except Exception as e:
-                    logger.error(f"Error deleting list {list_id}: {e}")
-                    # Continue with other lists even if one fails
-            
-            # Wait a moment for changes to propagate
-            import time
-            time.sleep(0.5)
+            # 2) Delete the cards concurrently, then the lists. Each DELETE goes by id through
+            # self._session: plankapy models share one request handler and are not thread-safe
+            list(self._executor.map(self._delete_card_safe, card_ids))
+            list(self._executor.map(self._delete_list_safe, list_ids))
             
             # 3) Delete the board itself
-            try:
-                # Find the board again just before deletion
-                board_obj = None
-                for project in self.client.projects:
-                    try:
-                        for board in project.boards:
-                            if board.id == board_id:
-                                board_obj = board
-                                break
-                    except Exception as e:
-                        logger.debug(f"Could not get boards for project {project.id} before final deletion: {e}")
-                    if board_obj:
-                        break
-                
-                if not board_obj:
-                    logger.warning(f"Board {board_id} not found (already deleted)")
-                    return True
-                    
-                board_obj.delete()
-                logger.debug(f"Successfully deleted board {board_id} with all contents")
-                return True
-            except requests.exceptions.HTTPError as e:
-                if e.response.status_code == 404:
-                    logger.warning(f"Board {board_id} not found (already deleted)")
-                    return True
-                else:
-                    logger.error(f"Error deleting board {board_id}: {e}")
-                    logger.error(f"Response body: {e.response.text if e.response else 'No response'}")
-                    return False
-            except Exception as e:
-                logger.error(f"Error deleting board {board_id}: {e}")
-                return False
+            return self._delete_board_cascade(board_id)
                 
         except Exception as e:
             logger.error(f"Error deleting board {board_id} with contents: {e}")
             return False
 
+    def _delete_project_request(self, project_id: str) -> Optional[bool]:
+        """
+        Send DELETE /projects/{id}.
+        
+        Returns True if the project is gone, False on error, and None if Planka
+        refused because the project still has boards (HTTP 422).
+        """
+        url = f"{self.api_url}/projects/{project_id}"
+        response = self._session.delete(url, timeout=REQUEST_TIMEOUT)
+        if response.status_code in _DELETED:
+            self._forget_project(project_id)
+            logger.info(f"Successfully deleted project {project_id}")
+            return True
+        elif response.status_code == 404:
+            # Project not found, consider it deleted
+            self._forget_project(project_id)
+            logger.warning(f"Project {project_id} not found (already deleted)")
+            return True
+        elif response.status_code == 422:
+            # "Must not have boards"
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Project %s still has boards: %s", project_id, _error_body(response))
+            return None
+        else:
+            logger.error(f"HTTP error deleting project {project_id}: HTTP {response.status_code}")
+            logger.error(f"Response body: {_error_body(response)}")
+            return False
+
     def delete_project(self, project_id: str) -> bool:
         """
         Delete a project from Planka.
         
+        The project is deleted directly; its boards are only deleted first if
+        Planka refuses because the project is not empty.
+        
         Args:
             project_id (str): The ID of the project to delete
             
@@ -640,106 +969,36 @@ class PlankaClient:
             bool: True if successful, False otherwise
         """
         try:
-            logger.debug(f"Attempting to delete project {project_id}")
-            
-            # Find the project
-            project_obj = None
-            for project in self.client.projects:
-                if project.id == project_id:
-                    project_obj = project
-                    break
+            logger.debug("Attempting to delete project %s", project_id)
             
-            if not project_obj:
-                logger.warning(f"Project {project_id} not found (already deleted)")
-                return True
+            deleted = self._delete_project_request(project_id)
+            if deleted is not None:
+                return deleted
             
-            # First delete all boards in this project
+            # Delete all boards in this project, then try again
             try:
-                boards = project_obj.boards
-                logger.debug(f"Found {len(boards)} boards to delete in project {project_id}")
+                # GET /projects/{id} includes the boards; projects are deleted from worker
+                # threads, so the shared plankapy handler is not used here
+                boards = self._api_get(f"/projects/{project_id}").get('included', {}).get('boards', [])
+                logger.debug("Found %s boards to delete in project %s", len(boards), project_id)
                 
-                # Delete each board with its contents
-                for board in boards:
-                    board_id = board.id
-                    if not self.delete_board_with_contents(board_id):
-                        logger.error(f"Failed to delete board {board_id} in project {project_id}")
-                        # Continue with other boards but return False at the end
+                # Delete the boards with their contents concurrently; they are independent
+                board_ids = [board['id'] for board in boards]
+                with ThreadPoolExecutor(max_workers=DELETE_WORKERS) as executor:
+                    for board_id, deleted in zip(board_ids, executor.map(self.delete_board_with_contents, board_ids)):
+                        if not deleted:
+                            logger.error(f"Failed to delete board {board_id} in project {project_id}")
+                            # Continue with other boards, the project delete below will report the failure
             
             except Exception as e:
                 logger.warning(f"Error getting/deleting boards for project {project_id}: {e}")
                 # Continue anyway
             
-            # Wait a moment for changes to propagate
-            import time
-            time.sleep(1.0)
-            
-            # Now try to delete the project
-            try:
-                # Find the project again just before deletion
-                project_obj = None
-                for project in self.client.projects:
-                    if project.id == project_id:
-                        project_obj = project
-                        break
-                
-                if not project_obj:
-                    logger.warning(f"Project {project_id} not found (already deleted)")
-                    return True
-                    
-                project_obj.delete()
-                logger.info(f"Successfully deleted project {project_id}")
-                return True
-            except requests.exceptions.HTTPError as http_err:
-                if http_err.response.status_code == 404:
-                    # Project not found, consider it deleted
-                    logger.warning(f"Project {project_id} not found (already deleted)")
-                    return True
-                elif http_err.response.status_code == 422:
-                    # Handle "Must not have boards" error
-                    error_msg = http_err.response.text if http_err.response else "No response"
-                    logger.error(f"Cannot delete project {project_id}: {error_msg}")
-                    # Try one more time after a longer delay
-                    import time
-                    time.sleep(2.0)
-                    
-                    try:
-                        # Find the project again
-                        project_obj = None
-                        for project in self.client.projects:
-                            if project.id == project_id:
-                                project_obj = project
-                                break
-                        
-                        if project_obj:
-                            # Check if it still has boards
-                            boards = project_obj.boards
-                            if len(boards) > 0:
-                                logger.debug(f"Project {project_id} still has {len(boards)} boards after delay")
-                                # Try to delete them again
-                                for board in boards:
-                                    board_id = board.id
-                                    if not self.delete_board_with_contents(board_id):
-                                        logger.error(f"Failed to delete board {board_id} on retry")
-                                
-                                # Wait a bit more for changes to propagate
-                                time.sleep(1.0)
-                        
-                        # Try one more time to delete the project
-                        if project_obj:
-                            project_obj.delete()
-                            logger.info(f"Successfully deleted project {project_id} on retry")
-                            return True
-                    except Exception as refresh_e:
-                        logger.error(f"Refresh failed for project {project_id}: {refresh_e}")
-                    
-                    return False
-                else:
-                    logger.error(f"HTTP error deleting project {project_id}: {http_err}")
-                    logger.error(f"Response body: {http_err.response.text if http_err.response else 'No response'}")
-                    return False
-            except Exception as e:
-                logger.error(f"Error deleting project {project_id}: {e}")
+            deleted = self._delete_project_request(project_id)
+            if deleted is None:
+                logger.error(f"Cannot delete project {project_id}: it still has boards")
                 return False
+            return deleted
                 
         except Exception as e:
             logger.error(f"Error deleting project {project_id}: {e}")
@@ -757,56 +1016,32 @@ class PlankaClient:
         try:
             logger.info("Starting to delete all boards and projects...")
             
-            # 1. Get all projects first
-            projects = self.get_projects()
-            logger.info(f"Found {len(projects)} projects to process")
-            
-            # 2. For each project, delete all boards with their contents
-            for project in projects:
-                project_id = project['id']
-                try:
-                    logger.debug(f"Processing project {project_id}")
-                    
-                    # Get boards for this specific project
-                    project_obj = None
-                    for p in self.client.projects:
-                        if p.id == project_id:
-                            project_obj = p
-                            break
-                    
-                    if not project_obj:
-                        logger.warning(f"Project {project_id} not found in client projects")
-                        continue
-                    
-                    # Get all boards in this project
-                    boards = project_obj.boards
-                    logger.info(f"Found {len(boards)} boards in project {project_id}")
-                    
-                    # Delete all boards with their contents
-                    for board in boards:
-                        board_id = board.id
-                        if not self.delete_board_with_contents(board_id):
-                            logger.error(f"Failed to delete board {board_id}")
-                            # Continue with other boards even if one fails
-                
-                except Exception as e:
-                    logger.error(f"Error processing project {project_id}: {e}")
-                    # Continue with other projects even if one fails
+            # 1. Collect all project and board ids once, up front, bypassing cached listings;
+            # GET /projects includes the boards, so a single request returns both
+            self.invalidate_cache()
+            data = self._api_get("/projects")
+            project_ids = [project['id'] for project in data.get('items', [])]
+            logger.info(f"Found {len(project_ids)} projects to process")
             
-            # 3. Wait a moment for changes to propagate and refresh client data
-            import time
-            time.sleep(1.0)
+            board_ids = [board['id'] for board in data.get('included', {}).get('boards', [])]
+            logger.info(f"Found {len(board_ids)} boards to delete")
             
-            # 4. Now delete all projects
-            projects = self.get_projects()
-            logger.info(f"Found {len(projects)} projects to delete")
-            
-            for project in projects:
-                project_id = project['id']
-                if not self.delete_project(project_id):
-                    logger.error(f"Failed to delete project {project_id}")
-                    # Continue with other projects even if one fails
+            # Boards and projects get their own pool: their deletions submit
+            # card deletions to self._executor and must not wait on themselves
+            with ThreadPoolExecutor(max_workers=DELETE_WORKERS) as executor:
+                # 2. Delete all boards with their contents concurrently
+                for board_id, deleted in zip(board_ids, executor.map(self.delete_board_with_contents, board_ids)):
+                    if not deleted:
+                        logger.error(f"Failed to delete board {board_id}")
+                        # Continue with other boards even if one fails
+                
+                # 3. Now delete all projects concurrently; deleting boards doesn't change the project list
+                for project_id, deleted in zip(project_ids, executor.map(self.delete_project, project_ids)):
+                    if not deleted:
+                        logger.error(f"Failed to delete project {project_id}")
+                        # Continue with other projects even if one fails
                     
+            self.invalidate_indexes()
             logger.info("Finished deleting all boards and projects")
             return True
             
@@ -824,174 +1059,65 @@ class PlankaClient:
         Known issue: Comment creation may fail due to API compatibility issues
         between the plankapy library and newer versions of Planka.
         """
-        logger.warning("Comment creation is currently not working due to API compatibility issues. "
-                      "This is a known limitation when using newer versions of Planka with the plankapy library.")
+        if not self._comment_warned:
+            self._comment_warned = True
+            logger.warning("Comment creation is currently not working due to API compatibility issues. "
+                          "This is a known limitation when using newer versions of Planka with the plankapy library.",
+                          stacklevel=2)
         return {}
 
-    def _get_card_by_id(self, card_id: str) -> Optional[Card_]:
-        """
-        Find a card by ID across all projects, boards, and lists using plankapy.
-        """
-        try:
-            for project in self.client.projects:
-                for board in project.boards:
-                    for lst in board.lists:
-                        for card in lst.cards:
-                            if card.id == card_id:
-                                return card
-        except Exception as e:
-            logger.error(f"Error finding card {card_id}: {e}")
-        return None
-
-    def _get_task_list_by_id(self, task_list_id: str) -> Optional[Task_]:
-        """
-        Find a task list by ID across all projects, boards, lists, and cards using plankapy.
-        """
-        try:
-            for project in self.client.projects:
-                for board in project.boards:
-                    for lst in board.lists:
-                        for card in lst.cards:
-                            for task_list in card.tasks:
-                                if task_list.id == task_list_id:
-                                    return task_list
-        except Exception as e:
-            logger.error(f"Error finding task list {task_list_id}: {e}")
-        return None
-
     # ---------- Чек-листы (task-lists) ----------
     def create_task_list(self, card_id: str, name: str, position: Optional[int] = None) -> Dict[str, Any]:
         """
-        Создать список задач (task-list) у карточки используя plankapy.
+        Создать список задач (task-list) у карточки.
+        
+        Отправляется через self._session, а не через plankapy: модели plankapy делят
+        один обработчик запросов, и из нескольких потоков POST может уйти на чужую карточку.
         """
         try:
-            # Find the card using plankapy
-            card = self._get_card_by_id(card_id)
-            if not card:
-                logger.error(f"Card with id {card_id} not found")
-                # Fallback to direct API call
-                url = f"{self.api_url}/cards/{card_id}/task-lists"
-                headers = {"Authorization": f"Bearer {self.api_key}", "Content-Type": "application/json"}
-                payload = {"name": name}
-                if position is not None:
-                    payload["position"] = int(position)
-                else:
-                    # Default position if not provided
-                    payload["position"] = 65535
-                resp = requests.post(url, headers=headers, json=payload)
-                if resp.status_code in (200, 201):
-                    item = resp.json().get("item", {})
-                    # «Двойная проверка»: наличие id и совпадение имени
-                    if item.get("id") and (item.get("name") == name or not name):
-                        return {"id": item.get("id"), "name": item.get("name")}
-                logger.error(f"Error creating task-list: HTTP {resp.status_code} - {resp.text}")
-                return {}
-            
-            # Create task list using plankapy method
-            kwargs = {}
-            if position is not None:
-                kwargs["position"] = int(position)
-            else:
-                # Default position if not provided
-                kwargs["position"] = 65535
-            
-            task_list = card.add_task(name=name, **kwargs)
-            
-            # Refresh card to get updated task lists
-            card.refresh()
-            
-            # Verify the task list was added
-            if task_list and hasattr(task_list, 'id'):
-                return {"id": task_list.id, "name": getattr(task_list, 'name', name)}
-            else:
-                logger.warning("Task list created but no ID returned")
-                return {"name": name}
-        except Exception as e:
-            logger.error(f"Error creating task list using plankapy: {e}")
-            # Fallback to direct API call
             url = f"{self.api_url}/cards/{card_id}/task-lists"
-            headers = {"Authorization": f"Bearer {self.api_key}", "Content-Type": "application/json"}
-            payload = {"name": name}
-            if position is not None:
-                payload["position"] = int(position)
-            else:
+            payload = {
+                "name": name,
                 # Default position if not provided
-                payload["position"] = 65535
-            resp = requests.post(url, headers=headers, json=payload)
-            if resp.status_code in (200, 201):
-                item = resp.json().get("item", {})
-                # «Двойная проверка»: наличие id и совпадение имени
-                if item.get("id") and (item.get("name") == name or not name):
-                    return {"id": item.get("id"), "name": item.get("name")}
-            logger.error(f"Error creating task-list: HTTP {resp.status_code} - {resp.text}")
+                "position": int(position) if position is not None else 65535
+            }
+            item = self._post_json(url, payload, "task-list")
+            if item is None:
+                return {}
+            # «Двойная проверка»: наличие id и совпадение имени
+            if item.get("id") and (item.get("name") == name or not name):
+                return {"id": item.get("id"), "name": item.get("name")}
+            logger.error(f"Error creating task-list: unexpected item {item}")
+            return {}
+        except Exception as e:
+            logger.error(f"Error creating task-list: {e}")
             return {}
 
     def create_task_in_list(self, task_list_id: str, name: str, is_completed: bool = False,
                             position: Optional[int] = None) -> Dict[str, Any]:
         """
-        Создать задачу (пункт чек-листа) внутри task-list используя plankapy.
+        Создать задачу (пункт чек-листа) внутри task-list.
+        
+        Как и create_task_list(), запрос идет через self._session, а не через plankapy.
         """
         try:
-            # Find the task list using plankapy
-            task_list = self._get_task_list_by_id(task_list_id)
-            if not task_list:
-                logger.error(f"Task list with id {task_list_id} not found")
-                # Fallback to direct API call
-                url = f"{self.api_url}/task-lists/{task_list_id}/tasks"
-                headers = {"Authorization": f"Bearer {self.api_key}", "Content-Type": "application/json"}
-                payload = {"name": name, "isCompleted": bool(is_completed)}
-                if position is not None:
-                    payload["position"] = int(position)
-                resp = requests.post(url, headers=headers, json=payload)
-                if resp.status_code in (200, 201):
-                    item = resp.json().get("item", {})
-                    # «Двойная проверка»: сверка имени и флага isCompleted
-                    if item.get("id"):
-                        ok_name = (item.get("name") == name) or not name
-                        ok_done = bool(item.get("isCompleted", False)) == bool(is_completed)
-                        if ok_name and ok_done:
-                            return {"id": item.get("id"), "name": item.get("name"), "isCompleted": item.get("isCompleted", False)}
-                logger.error(f"Error creating task in list: HTTP {resp.status_code} - {resp.text}")
-                return {}
-            
-            # Create task item using plankapy method
-            kwargs = {}
-            if position is not None:
-                kwargs["position"] = int(position)
-            
-            task_item = task_list.add_task_item(name=name, is_completed=is_completed, **kwargs)
-            
-            # Refresh task list to get updated items
-            task_list.refresh()
-            
-            # Verify the task item was added
-            if task_item and hasattr(task_item, 'id'):
-                return {
-                    "id": task_item.id, 
-                    "name": getattr(task_item, 'name', name),
-                    "isCompleted": getattr(task_item, 'is_completed', is_completed)
-                }
-            else:
-                logger.warning("Task item created but no ID returned")
-                return {"name": name, "isCompleted": is_completed}
-        except Exception as e:
-            logger.error(f"Error creating task item using plankapy: {e}")
-            # Fallback to direct API call
             url = f"{self.api_url}/task-lists/{task_list_id}/tasks"
-            headers = {"Authorization": f"Bearer {self.api_key}", "Content-Type": "application/json"}
             payload = {"name": name, "isCompleted": bool(is_completed)}
             if position is not None:
                 payload["position"] = int(position)
-            resp = requests.post(url, headers=headers, json=payload)
-            if resp.status_code in (200, 201):
-                item = resp.json().get("item", {})
-                # «Двойная проверка»: сверка имени и флага isCompleted
-                if item.get("id"):
-                    ok_name = (item.get("name") == name) or not name
-                    ok_done = bool(item.get("isCompleted", False)) == bool(is_completed)
-                    if ok_name and ok_done:
-                        return {"id": item.get("id"), "name": item.get("name"), "isCompleted": item.get("isCompleted", False)}
-            logger.error(f"Error creating task in list: HTTP {resp.status_code} - {resp.text}")
+            item = self._post_json(url, payload, "task in list")
+            if item is None:
+                return {}
+            # «Двойная проверка»: сверка имени и флага isCompleted
+            if item.get("id"):
+                ok_name = (item.get("name") == name) or not name
+                ok_done = bool(item.get("isCompleted", False)) == bool(is_completed)
+                if ok_name and ok_done:
+                    return {"id": item.get("id"), "name": item.get("name"), "isCompleted": item.get("isCompleted", False)}
+            logger.error(f"Error creating task in list: unexpected item {item}")
+            return {}
+        except Exception as e:
+            logger.error(f"Error creating task in list: {e}")
             return {}
 
 
@@ -1011,18 +1137,14 @@ class PlankaClient:
             # First, let's try to create an attachment-like entry for the link
             # Planka typically treats external links as attachments with URL content
             url_endpoint = f"{self.api_url}/cards/{card_id}/attachments"
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
             data = {
                 "url": url,
                 "name": name if name else url,
                 "type": "link"
             }
             
-            response = requests.post(url_endpoint, headers=headers, json=data)
-            if response.status_code in [200, 201]:
+            response = self._session.post(url_endpoint, json=data, timeout=REQUEST_TIMEOUT)
+            if response.status_code in _CREATED:
                 result = response.json()
                 link_data = result.get('item', {})
                 return {
@@ -1031,7 +1153,7 @@ class PlankaClient:
                     'url': link_data.get('url')
                 }
             else:
-                logger.error(f"Error creating external link: HTTP {response.status_code} - {response.text}")
+                logger.error(f"Error creating external link: HTTP {response.status_code} - {_error_body(response)}")
                 return {}
         except Exception as e:
             logger.error(f"Error creating external link: {e}")
@@ -1057,13 +1179,12 @@ class PlankaClient:
         """
         try:
             # Use the plankapy client to get projects
-            projects = self.client.projects
+            projects = self._projects_iter()
             
             # Add the add_project_manager method to each project if it doesn't exist
             for project in projects:
                 if not hasattr(project, 'add_project_manager'):
                     # Bind the method to the project instance
-                    import types
                     project.add_project_manager = types.MethodType(self._add_project_manager, project)
             
             return projects
@@ -1082,22 +1203,18 @@ class PlankaClient:
         try:
             # Исправлен endpoint - используем /project-managers вместо /users
             url = f"{self.api_url}/projects/{project_obj.id}/project-managers"
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
             data = {
                 "userId": user.id
             }
             
-            response = requests.post(url, headers=headers, json=data)
-            if response.status_code in [200, 201]:
+            response = self._session.post(url, json=data, timeout=REQUEST_TIMEOUT)
+            if response.status_code in _CREATED:
                 logger.info(f"Successfully added user {user.id} as manager to project {project_obj.id}")
                 # Refresh the project after adding a manager
                 project_obj.refresh()
             else:
-                logger.error(f"Error adding project manager: HTTP {response.status_code} - {response.text}")
-                raise requests.exceptions.HTTPError(f"HTTP {response.status_code} - {response.text}")
+                logger.error(f"Error adding project manager: HTTP {response.status_code} - {_error_body(response)}")
+                raise requests.exceptions.HTTPError(f"HTTP {response.status_code} - {_error_body(response)}")
         except Exception as e:
             logger.error(f"Error adding project manager: {e}")
             raise
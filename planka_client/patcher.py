@@ -7,6 +7,53 @@ from plankapy.models import Project_, User_, Board_, List_, Card_
 
 logger = logging.getLogger(__name__)
 
+# Fields accepted by the plankapy dataclasses; anything else is stored as a plain attribute
+PROJECT_FIELDS = frozenset({
+    'id', 'name', 'background', 'backgroundImage', 
+    'createdAt', 'updatedAt'
+})
+USER_FIELDS = frozenset({
+    'id', 'name', 'username', 'email', 'language', 'organization', 'phone',
+    'avatarUrl', 'isSso', 'isAdmin', 'isDeletionLocked', 'isLocked',
+    'isRoleLocked', 'isUsernameLocked', 'subscribeToOwnCards',
+    'createdAt', 'updatedAt', 'deletedAt'
+})
+BOARD_FIELDS = frozenset({
+    'id', 'name', 'position', 'projectId', 'createdAt', 'updatedAt'
+})
+LIST_FIELDS = frozenset({
+    'id', 'name', 'position', 'boardId', 'color', 'createdAt', 'updatedAt'
+})
+CARD_FIELDS = frozenset({
+    'id', 'name', 'position', 'description', 'dueDate', 'isDueDateCompleted',
+    'stopwatch', 'boardId', 'listId', 'creatorUserId', 'coverAttachmentId',
+    'isSubscribed', 'createdAt', 'updatedAt'
+})
+
+
+def _make_patched_init(original_init, allowed_fields):
+    """
+    Build an __init__ that passes the dataclass fields to original_init and
+    stores every other field as a plain attribute.
+    """
+    def patched_init(self, **kwargs):
+        # Split the fields in a single pass over kwargs
+        filtered_kwargs = {}
+        extra_fields = {}
+        for k, v in kwargs.items():
+            if k in allowed_fields:
+                filtered_kwargs[k] = v
+            else:
+                extra_fields[k] = v
+        
+        # Call the original __init__ with only allowed fields
+        original_init(self, **filtered_kwargs)
+        
+        # Store extra fields as attributes
+        self.__dict__.update(extra_fields)
+    
+    return patched_init
+
 
 def patch_plankapy():
     """
@@ -18,105 +65,12 @@ def patch_plankapy():
     """
     
     try:
-        # Save the original __init__ methods
-        original_project_init = Project_.__init__
-        original_user_init = User_.__init__
-        original_board_init = Board_.__init__
-        original_list_init = List_.__init__
-        original_card_init = Card_.__init__
-        
-        # Monkey patch the Project_ class to handle extra fields
-        def patched_project_init(self, **kwargs):
-            # Filter out extra fields that aren't part of the dataclass
-            allowed_fields = {
-                'id', 'name', 'background', 'backgroundImage', 
-                'createdAt', 'updatedAt'
-            }
-            filtered_kwargs = {k: v for k, v in kwargs.items() if k in allowed_fields}
-            
-            # Call the original __init__ with only allowed fields
-            original_project_init(self, **filtered_kwargs)
-            
-            # Store extra fields as attributes
-            for k, v in kwargs.items():
-                if k not in allowed_fields:
-                    setattr(self, k, v)
-        
-        # Monkey patch the User_ class to handle extra fields
-        def patched_user_init(self, **kwargs):
-            # Filter out extra fields that aren't part of the dataclass
-            allowed_fields = {
-                'id', 'name', 'username', 'email', 'language', 'organization', 'phone',
-                'avatarUrl', 'isSso', 'isAdmin', 'isDeletionLocked', 'isLocked',
-                'isRoleLocked', 'isUsernameLocked', 'subscribeToOwnCards',
-                'createdAt', 'updatedAt', 'deletedAt'
-            }
-            filtered_kwargs = {k: v for k, v in kwargs.items() if k in allowed_fields}
-            
-            # Call the original __init__ with only allowed fields
-            original_user_init(self, **filtered_kwargs)
-            
-            # Store extra fields as attributes
-            for k, v in kwargs.items():
-                if k not in allowed_fields:
-                    setattr(self, k, v)
-        
-        # Monkey patch the Board_ class to handle extra fields
-        def patched_board_init(self, **kwargs):
-            # Filter out extra fields that aren't part of the dataclass
-            allowed_fields = {
-                'id', 'name', 'position', 'projectId', 'createdAt', 'updatedAt'
-            }
-            filtered_kwargs = {k: v for k, v in kwargs.items() if k in allowed_fields}
-            
-            # Call the original __init__ with only allowed fields
-            original_board_init(self, **filtered_kwargs)
-            
-            # Store extra fields as attributes
-            for k, v in kwargs.items():
-                if k not in allowed_fields:
-                    setattr(self, k, v)
-        
-        # Monkey patch the List_ class to handle extra fields
-        def patched_list_init(self, **kwargs):
-            # Filter out extra fields that aren't part of the dataclass
-            allowed_fields = {
-                'id', 'name', 'position', 'boardId', 'color', 'createdAt', 'updatedAt'
-            }
-            filtered_kwargs = {k: v for k, v in kwargs.items() if k in allowed_fields}
-            
-            # Call the original __init__ with only allowed fields
-            original_list_init(self, **filtered_kwargs)
-            
-            # Store extra fields as attributes
-            for k, v in kwargs.items():
-                if k not in allowed_fields:
-                    setattr(self, k, v)
-        
-        # Monkey patch the Card_ class to handle extra fields
-        def patched_card_init(self, **kwargs):
-            # Filter out extra fields that aren't part of the dataclass
-            allowed_fields = {
-                'id', 'name', 'position', 'description', 'dueDate', 'isDueDateCompleted',
-                'stopwatch', 'boardId', 'listId', 'creatorUserId', 'coverAttachmentId',
-                'isSubscribed', 'createdAt', 'updatedAt'
-            }
-            filtered_kwargs = {k: v for k, v in kwargs.items() if k in allowed_fields}
-            
-            # Call the original __init__ with only allowed fields
-            original_card_init(self, **filtered_kwargs)
-            
-            # Store extra fields as attributes
-            for k, v in kwargs.items():
-                if k not in allowed_fields:
-                    setattr(self, k, v)
-        
-        # Apply the monkey patches
-        Project_.__init__ = patched_project_init
-        User_.__init__ = patched_user_init
-        Board_.__init__ = patched_board_init
-        List_.__init__ = patched_list_init
-        Card_.__init__ = patched_card_init
+        # Monkey patch the model classes to handle extra fields
+        Project_.__init__ = _make_patched_init(Project_.__init__, PROJECT_FIELDS)
+        User_.__init__ = _make_patched_init(User_.__init__, USER_FIELDS)
+        Board_.__init__ = _make_patched_init(Board_.__init__, BOARD_FIELDS)
+        List_.__init__ = _make_patched_init(List_.__init__, LIST_FIELDS)
+        Card_.__init__ = _make_patched_init(Card_.__init__, CARD_FIELDS)
         
         logger.info("Successfully patched plankapy library")
         return True
@@ -124,7 +78,3 @@ def patch_plankapy():
     except Exception as e:
         logger.error(f"Error patching plankapy library: {e}")
         return False
-
-
-# Apply the patches when this module is imported
-patch_plankapy()
\ No newline at end of file
@@ -5,24 +5,57 @@ Test runner for all migration tests.
 
 import sys
 import os
+import io
+import argparse
+import fnmatch
 import unittest
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 
-# Add project root to path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+TEST_PATTERN = 'test_*.py'
 
-def run_tests():
-    """Run all tests."""
-    # Discover and run tests
-    loader = unittest.TestLoader()
+def run_test_file(start_dir, filename):
+    """Run the tests of a single file, returning (success, runner output)."""
+    stream = io.StringIO()
+    suite = unittest.TestLoader().discover(start_dir, pattern=filename)
+    result = unittest.TextTestRunner(stream=stream, verbosity=2).run(suite)
+    return result.wasSuccessful(), stream.getvalue()
+
+def run_tests(jobs=None):
+    """
+    Run all tests.
+    
+    Test files run in parallel worker processes (processes rather than threads,
+    since the tests patch module globals). jobs=1 runs everything in this process.
+    """
     start_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tests')
-    suite = loader.discover(start_dir, pattern='test_*.py')
+    jobs = jobs or os.cpu_count() or 1
+    
+    if jobs == 1:
+        # Discover and run tests
+        loader = unittest.TestLoader()
+        suite = loader.discover(start_dir, pattern=TEST_PATTERN)
+        
+        # Run tests
+        runner = unittest.TextTestRunner(verbosity=2)
+        result = runner.run(suite)
+        
+        # Return exit code based on test results
+        return 0 if result.wasSuccessful() else 1
+    
+    test_files = sorted(f for f in os.listdir(start_dir) if fnmatch.fnmatch(f, TEST_PATTERN))
+    with ProcessPoolExecutor(max_workers=max(1, min(jobs, len(test_files)))) as executor:
+        results = list(executor.map(run_test_file, repeat(start_dir), test_files))
     
-    # Run tests
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
+    # Report in file order once everything has finished
+    for _, output in results:
+        sys.stderr.write(output)
     
-    # Return exit code based on test results
-    return 0 if result.wasSuccessful() else 1
+    return 0 if all(success for success, _ in results) else 1
 
 if __name__ == '__main__':
-    sys.exit(run_tests())
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Run the migration tests")
+    parser.add_argument('-j', '--jobs', type=int, default=None,
+                        help="Number of test files run in parallel (default: CPU count, 1 = serial)")
+    args = parser.parse_args()
+    sys.exit(run_tests(args.jobs))
\ No newline at end of file
@@ -0,0 +1,107 @@
+"""
+Tests for attachment migration functionality.
+"""
+
+import unittest
+import os
+from unittest.mock import MagicMock, patch
+
+# Add project root to path
+import _path  # noqa: F401
+
+from migrator import KaitenToPlankaMigrator, DOWNLOAD_TIMEOUT, MAX_ATTACHMENT_SIZE
+from kaiten_client import KaitenClient
+from planka_client import PlankaClient
+
+
+def _mock_download(chunks):
+    """Build a mock streaming response that yields the given chunks."""
+    response = MagicMock()
+    response.status_code = 200
+    response.iter_content.return_value = iter(chunks)
+    response.__enter__.return_value = response
+    return response
+
+
+class TestAttachmentMigration(unittest.TestCase):
+    
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures shared by all tests of the class."""
+        cls.kaiten_client = KaitenClient("https://test.kaiten.ru", "test-key")
+        cls.planka_client = PlankaClient("https://test.planka.ru", "test-key")
+        cls.migrator = KaitenToPlankaMigrator(cls.kaiten_client, cls.planka_client)
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Release the migrator's and clients' worker threads and sessions."""
+        cls.migrator.close()
+        cls.planka_client.close()
+        cls.kaiten_client.close()
+    
+    @patch('requests.Session.get')
+    @patch('kaiten_client.client.KaitenClient.get_attachments')
+    @patch('planka_client.client.PlankaClient.upload_attachment')
+    def test_oversized_attachment_without_content_length_is_skipped(self, mock_upload,
+                                                                     mock_get_attachments, mock_get):
+        """Test that the size limit is enforced while streaming the download."""
+        mock_get_attachments.return_value = [{"url": "https://files.kaiten.ru/big.bin", "name": "big.bin"}]
+        chunk = b"x" * (1024 * 1024)
+        mock_get.return_value = _mock_download([chunk] * (MAX_ATTACHMENT_SIZE // len(chunk) + 1))
+        
+        self.migrator.migrate_attachments(1, "card-1")
+        
+        mock_get.assert_called_once_with("https://files.kaiten.ru/big.bin", stream=True, timeout=DOWNLOAD_TIMEOUT)
+        mock_upload.assert_not_called()
+    
+    @patch('requests.Session.get')
+    @patch('kaiten_client.client.KaitenClient.get_attachments')
+    @patch('planka_client.client.PlankaClient.upload_attachment')
+    def test_attachment_is_uploaded_and_temp_file_removed(self, mock_upload,
+                                                          mock_get_attachments, mock_get):
+        """Test that a small attachment is uploaded and its temporary file cleaned up."""
+        mock_get_attachments.return_value = [{"url": "https://files.kaiten.ru/a.txt", "name": "a.txt"}]
+        mock_get.return_value = _mock_download([b"hello ", b"world"])
+        mock_upload.return_value = {"id": "att-1", "name": "a.txt"}
+        
+        self.migrator.migrate_attachments(1, "card-1")
+        
+        mock_upload.assert_called_once()
+        tmp_file_path = mock_upload.call_args.kwargs['file_path']
+        self.assertFalse(os.path.exists(tmp_file_path))
+    
+    @patch('kaiten_client.client.KaitenClient.get_attachments')
+    @patch('planka_client.client.PlankaClient.upload_attachment')
+    def test_download_does_not_send_kaiten_credentials(self, mock_upload, mock_get_attachments):
+        """Test that attachments are fetched through a session without the Kaiten API key."""
+        mock_get_attachments.return_value = [{"url": "https://s3.example.com/a.txt?X-Amz-Signature=x", "name": "a.txt"}]
+        mock_upload.return_value = {"id": "att-1", "name": "a.txt"}
+        
+        with patch.object(self.migrator._download_session, 'get', return_value=_mock_download([b"a"])) as mock_get:
+            self.migrator.migrate_attachments(1, "card-1")
+        
+        mock_get.assert_called_once()
+        self.assertNotIn('Authorization', self.migrator._download_session.headers)
+    
+    @patch('migrator.os.unlink', wraps=os.unlink)
+    @patch('requests.Session.get')
+    @patch('kaiten_client.client.KaitenClient.get_attachments')
+    @patch('planka_client.client.PlankaClient.upload_attachment')
+    def test_partial_download_is_removed_on_error(self, mock_upload, mock_get_attachments,
+                                                  mock_get, mock_unlink):
+        """Test that a download failing mid-stream leaves no temporary file behind."""
+        def chunks():
+            yield b"partial"
+            raise ConnectionResetError("connection reset by peer")
+        mock_get_attachments.return_value = [{"url": "https://files.kaiten.ru/a.txt", "name": "a.txt"}]
+        mock_get.return_value = _mock_download(chunks())
+        
+        self.migrator.migrate_attachments(1, "card-1")
+        
+        mock_upload.assert_not_called()
+        mock_unlink.assert_called_once()
+        self.assertFalse(os.path.exists(mock_unlink.call_args.args[0]))
+
+
+if __name__ == '__main__':
+    unittest.main()
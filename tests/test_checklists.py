@@ -3,12 +3,12 @@ Tests for checklist migration functionality.
 """
 
 import unittest
-import sys
-import os
-from unittest.mock import patch
+from unittest.mock import DEFAULT, call, patch
+
+import requests
 
 # Add project root to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import _path  # noqa: F401
 
 from migrator import KaitenToPlankaMigrator
 from kaiten_client import KaitenClient
@@ -17,68 +17,85 @@ from planka_client import PlankaClient
 
 class TestChecklistMigration(unittest.TestCase):
     
-    def setUp(self):
-        """Set up test fixtures."""
+    @classmethod
+    def setUpClass(cls):
+        """Set up test fixtures shared by all tests of the class."""
+        # Requests that escape the mocks fail immediately instead of waiting on DNS and retries
+        cls.network_patcher = patch(
+            'requests.Session.request',
+            side_effect=requests.exceptions.ConnectionError("network access is disabled in tests")
+        )
+        cls.network_patcher.start()
+        
         # Create mock clients
-        self.kaiten_client = KaitenClient("https://test.kaiten.ru", "test-key")
-        self.planka_client = PlankaClient("https://test.planka.ru", "test-key")
+        cls.kaiten_client = KaitenClient("https://test.kaiten.ru", "test-key")
+        cls.planka_client = PlankaClient("https://test.planka.ru", "test-key")
         
         # Create migrator with mock clients
-        self.migrator = KaitenToPlankaMigrator(self.kaiten_client, self.planka_client)
+        cls.migrator = KaitenToPlankaMigrator(cls.kaiten_client, cls.planka_client)
     
-    @patch('kaiten_client.client.KaitenClient.get_checklists')
-    @patch('kaiten_client.client.KaitenClient.get_checklist_details')
-    @patch('planka_client.client.PlankaClient.create_checklist')
-    @patch('planka_client.client.PlankaClient.create_checklist_item')
-    def test_migrate_checklists_with_details(self, mock_create_item, mock_create_checklist, 
-                                           mock_get_details, mock_get_checklists):
+    @classmethod
+    def tearDownClass(cls):
+        """Release the migrator's and clients' worker threads and sessions."""
+        cls.migrator.close()
+        cls.planka_client.close()
+        cls.kaiten_client.close()
+        cls.network_patcher.stop()
+    
+    @patch.multiple('kaiten_client.client.KaitenClient', get_checklists=DEFAULT, get_checklist_details=DEFAULT)
+    @patch.multiple('planka_client.client.PlankaClient', create_task_list=DEFAULT, create_task_in_list=DEFAULT)
+    def test_migrate_checklists_with_details(self, **mocks):
         """Test migrating checklists with detailed information."""
+        mock_get_checklists = mocks['get_checklists']
+        mock_get_details = mocks['get_checklist_details']
+        mock_create_task_list = mocks['create_task_list']
+        mock_create_task = mocks['create_task_in_list']
+        
         # Mock Kaiten checklists response
         mock_get_checklists.return_value = [
             {
                 "id": 4526413,
                 "name": "Чек-лист",
-                "checked_items": 12,
-                "total_items": 12
+                "checked_items": 1,
+                "total_items": 2
+            },
+            {
+                "id": 4526414,
+                "name": "Second",
+                "checked_items": 0,
+                "total_items": 1
             }
         ]
         
         # Mock Kaiten checklist details response
-        mock_get_details.return_value = {
-            "items": [
-                {
-                    "text": "Item 1",
-                    "checked": True
-                },
-                {
-                    "text": "Item 2",
-                    "checked": False
-                }
-            ]
-        }
-        
-        # Mock Planka checklist creation response
-        mock_create_checklist.return_value = {
-            "id": "task-1",
-            "name": "Чек-лист"
+        details = {
+            4526413: {"items": [{"text": "Item 1", "checked": True}, {"text": "Item 2", "checked": False}]},
+            4526414: {"items": [{"text": "Item 3", "checked": False}]}
         }
+        mock_get_details.side_effect = lambda card_id, checklist_id: details[checklist_id]
         
-        # Mock Planka checklist item creation response
-        mock_create_item.return_value = {
-            "id": "item-1",
-            "name": "Item 1",
-            "isCompleted": True
+        # Mock Planka task-list and task creation responses
+        mock_create_task_list.side_effect = lambda card_id, name, position: {"id": f"tl-{position}", "name": name}
+        mock_create_task.side_effect = lambda task_list_id, name, is_completed, position: {
+            "id": f"{task_list_id}-{position}", "name": name, "isCompleted": is_completed
         }
         
         # Run the migration
         self.migrator.migrate_checklists(23136662, "card-1")
         
-        # Verify calls were made
+        # Verify calls were made; checklists are created in order, one position step apart
         mock_get_checklists.assert_called_once_with(23136662)
-        mock_get_details.assert_called_once_with(23136662, 4526413)
-        mock_create_checklist.assert_called_once_with(card_id="card-1", name="Чек-лист")
-        self.assertEqual(mock_create_item.call_count, 2)
-
+        self.assertEqual(mock_get_details.call_args_list, [call(23136662, 4526413), call(23136662, 4526414)])
+        self.assertEqual(mock_create_task_list.call_args_list, [
+            call(card_id="card-1", name="Чек-лист", position=65535),
+            call(card_id="card-1", name="Second", position=131070)
+        ])
+        # Items run on the shared pool, so only their set (with positions) is fixed
+        self.assertCountEqual(mock_create_task.call_args_list, [
+            call(task_list_id="tl-65535", name="Item 1", is_completed=True, position=0),
+            call(task_list_id="tl-65535", name="Item 2", is_completed=False, position=65535),
+            call(task_list_id="tl-131070", name="Item 3", is_completed=False, position=0)
+        ])
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
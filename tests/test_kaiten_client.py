@@ -3,13 +3,13 @@ Tests for Kaiten client functionality.
 """
 
 import unittest
-import sys
-import os
+from unittest.mock import Mock, patch
 
 # Add project root to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import _path  # noqa: F401
 
 from kaiten_client import KaitenClient
+from kaiten_client.client import _RateLimiter
 import config
 
 
@@ -38,8 +38,37 @@ class TestKaitenClient(unittest.TestCase):
             'get_attachments'
         ]
         
-        for method in required_methods:
-            self.assertTrue(hasattr(client, method), f"KaitenClient missing method: {method}")
+        missing = set(required_methods).difference(dir(client))
+        self.assertFalse(missing, f"KaitenClient missing methods: {sorted(missing)}")
+            
+    @patch('kaiten_client.client.time.sleep')
+    @patch('kaiten_client.client.time.monotonic', side_effect=[0.0, 1.0, 2.0, 61.0])
+    def test_rate_limiter_waits_for_window(self, mock_monotonic, mock_sleep):
+        """Test that requests beyond the per-minute limit wait for the oldest one to leave the window."""
+        limiter = _RateLimiter(rpm_limit=2)
+        
+        limiter.wait()
+        limiter.wait()
+        mock_sleep.assert_not_called()
+        
+        limiter.wait()
+        mock_sleep.assert_called_once_with(58.0)
+        
+    def test_library_list_calls_wait_for_rate_limit(self):
+        """Test that the list_of() calls made by the kaiten library also count against the RPM limit."""
+        client = KaitenClient(config.KAITEN_API_URL, config.KAITEN_API_KEY, rpm_limit=10)
+        client._rate_limiter = Mock()
+        client.client = Mock()
+        client.client.list_of.return_value.cards.return_value = []
+        client.client.list_of.return_value.users.return_value = []
+        client.client.list_of.return_value.tags.return_value = []
+        
+        client.get_cards(1)
+        client.get_users()
+        client.get_tags()
+        
+        self.assertEqual(client._rate_limiter.wait.call_count, 3)
+        client.close()
 
 
 if __name__ == '__main__':
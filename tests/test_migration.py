@@ -3,11 +3,9 @@ Integration tests for the complete migration process.
 """
 
 import unittest
-import sys
-import os
 
 # Add project root to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import _path  # noqa: F401
 
 from migrator import KaitenToPlankaMigrator
 from kaiten_client import KaitenClient
@@ -34,8 +32,8 @@ class TestMigrationIntegration(unittest.TestCase):
             'migrate_all'
         ]
         
-        for method in required_methods:
-            self.assertTrue(hasattr(migrator, method), f"KaitenToPlankaMigrator missing method: {method}")
+        missing = set(required_methods).difference(dir(migrator))
+        self.assertFalse(missing, f"KaitenToPlankaMigrator missing methods: {sorted(missing)}")
 
 
 if __name__ == '__main__':
@@ -2,253 +2,291 @@
 Tests for Planka client functionality.
 """
 
-import unittest
-import sys
 import os
-from unittest.mock import Mock, patch
+import tempfile
+import unittest
+from email.parser import BytesParser
+from email.policy import HTTP
+from unittest.mock import Mock, PropertyMock, patch
+
+import requests
 
 # Add project root to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import _path  # noqa: F401
 
 from planka_client import PlankaClient
-import config
+from planka_client.client import REQUEST_TIMEOUT, _PlankaRetry
+from config import PLANKA_API_KEY, PLANKA_API_URL
+
+
+def _response(payload=None, status_code=200):
+    """Build a fake requests.Response returning payload from .json()."""
+    response = Mock(status_code=status_code)
+    response.json.return_value = payload
+    return response
 
 
 class TestPlankaClient(unittest.TestCase):
     
-    @patch('planka_client.client.requests.Session')
-    def test_init(self, mock_session):
+    def setUp(self):
+        """Patch requests.Session so every client in a test shares one mock session."""
+        patcher = patch('planka_client.client.requests.Session')
+        self.session = patcher.start().return_value
+        self.addCleanup(patcher.stop)
+        
+    def test_init(self):
         """Test PlankaClient initialization."""
-        client = PlankaClient(config.PLANKA_API_URL, config.PLANKA_API_KEY)
-        self.assertEqual(client.api_url, config.PLANKA_API_URL)
-        self.assertEqual(client.api_key, config.PLANKA_API_KEY)
+        client = PlankaClient(PLANKA_API_URL, PLANKA_API_KEY)
+        self.assertEqual(client.api_url, PLANKA_API_URL)
+        self.assertEqual(client.api_key, PLANKA_API_KEY)
         
-    @patch('planka_client.client.requests.get')
     @patch('planka_client.client.Planka')
-    def test_get_projects(self, mock_planka, mock_get):
-        """Test getting projects from Planka."""
-        # Mock the plankapy client
-        mock_project1 = Mock()
-        mock_project1.id = "1"
-        mock_project1.name = "Project 1"
+    def test_plankapy_client_is_created_lazily(self, mock_planka):
+        """Test that plankapy is only initialized when a method needs it."""
+        self.session.post.return_value = _response({"item": {"id": "1", "name": "New Card"}}, 201)
         
-        mock_project2 = Mock()
-        mock_project2.id = "2"
-        mock_project2.name = "Project 2"
+        client = PlankaClient(PLANKA_API_URL, PLANKA_API_KEY)
+        client.create_card("1", "New Card")
+        mock_planka.assert_not_called()
         
-        mock_planka_instance = Mock()
-        mock_planka_instance.projects = [mock_project1, mock_project2]
-        mock_planka.return_value = mock_planka_instance
+        client.client
+        client.client
+        mock_planka.assert_called_once()
+        
+    def test_get_projects(self):
+        """Test getting projects from Planka."""
+        # Mock the response
+        self.session.get.return_value = _response({
+            "items": [
+                {"id": "1", "name": "Project 1"},
+                {"id": "2", "name": "Project 2"}
+            ]
+        })
         
         # Create a new client with mocked dependencies
-        client = PlankaClient(config.PLANKA_API_URL, config.PLANKA_API_KEY)
+        client = PlankaClient(PLANKA_API_URL, PLANKA_API_KEY)
         projects = client.get_projects()
         
         self.assertEqual(len(projects), 2)
         self.assertEqual(projects[0]["name"], "Project 1")
         self.assertEqual(projects[1]["name"], "Project 2")
         
-    @patch('planka_client.client.requests.post')
-    def test_create_project(self, mock_post):
-        """Test creating a project in Planka."""
-        # Mock the response
-        mock_response = Mock()
-        mock_response.status_code = 201
-        mock_response.json.return_value = {
-            "item": {
-                "id": "1",
-                "name": "New Project"
-            }
-        }
-        mock_post.return_value = mock_response
-        
-        # Create a new client with mocked dependencies
-        client = PlankaClient(config.PLANKA_API_URL, config.PLANKA_API_KEY)
-        project = client.create_project("New Project", "Test project")
-        
-        self.assertEqual(project["name"], "New Project")
-        # Note: The current implementation doesn't return description
-        
-    @patch('planka_client.client.Planka')
-    def test_get_boards(self, mock_planka):
+    def test_get_projects_is_cached_until_create(self):
+        """Test that projects are fetched once until a project is created."""
+        self.session.get.return_value = _response({"items": [{"id": "1", "name": "Project 1"}]})
+        
+        self.session.post.return_value = _response({"item": {"id": "2", "name": "Project 2"}}, 201)
+        
+        client = PlankaClient(PLANKA_API_URL, PLANKA_API_KEY)
+        client.get_projects()
+        client.get_projects()
+        self.assertEqual(self.session.get.call_count, 1)
+        
+        client.create_project("Project 2")
+        client.get_projects()
+        self.assertEqual(self.session.get.call_count, 2)
+        
+    def test_create_returns_created_item(self):
+        """Test that each create_* method POSTs once and returns the created item."""
+        cases = [
+            ("create_project", ("New Project", "Test project"), {"id": "1", "name": "New Project"}),
+            ("create_board", ("1", "New Board", "Test board"), {"id": "1", "name": "New Board"}),
+            ("create_list", ("1", "New List", 65535), {"id": "1", "name": "New List"}),
+            ("create_card", ("1", "New Card", "Test card", 65535), {"id": "1", "name": "New Card"}),
+            ("create_label", ("1", "New Label", "#CCCCCC"), {"id": "1", "name": "New Label", "color": "#CCCCCC"}),
+        ]
+        for method, args, item in cases:
+            with self.subTest(method=method):
+                self.session.post.reset_mock()
+                self.session.post.return_value = _response({"item": item}, 201)
+                
+                client = PlankaClient(PLANKA_API_URL, PLANKA_API_KEY)
+                result = getattr(client, method)(*args)
+                
+                self.assertEqual(result["name"], item["name"])
+                self.assertEqual(result.get("color"), item.get("color"))
+                self.session.post.assert_called_once()
+        
+    def test_get_boards(self):
         """Test getting boards from Planka."""
-        # Mock the plankapy client
-        mock_board1 = Mock()
-        mock_board1.id = "1"
-        mock_board1.name = "Board 1"
-        
-        mock_board2 = Mock()
-        mock_board2.id = "2"
-        mock_board2.name = "Board 2"
-        
-        mock_project = Mock()
-        mock_project.boards = [mock_board1, mock_board2]
-        
-        mock_planka_instance = Mock()
-        mock_planka_instance.projects = [mock_project]
-        mock_planka.return_value = mock_planka_instance
+        # Mock the response; boards are included in GET /projects
+        self.session.get.return_value = _response({
+            "items": [{"id": "p1", "name": "Project 1"}],
+            "included": {
+                "boards": [
+                    {"id": "1", "name": "Board 1", "projectId": "p1"},
+                    {"id": "2", "name": "Board 2", "projectId": "p1"}
+                ]
+            }
+        })
         
         # Create a new client with mocked dependencies
-        client = PlankaClient(config.PLANKA_API_URL, config.PLANKA_API_KEY)
+        client = PlankaClient(PLANKA_API_URL, PLANKA_API_KEY)
         boards = client.get_boards()
         
         self.assertEqual(len(boards), 2)
         self.assertEqual(boards[0]["name"], "Board 1")
         self.assertEqual(boards[1]["name"], "Board 2")
+        self.session.get.assert_called_once_with(f"{client.api_url}/projects", timeout=REQUEST_TIMEOUT)
         
-    @patch('planka_client.client.requests.post')
-    def test_create_board(self, mock_post):
-        """Test creating a board in Planka."""
-        # Mock the response
-        mock_response = Mock()
-        mock_response.status_code = 201
-        mock_response.json.return_value = {
-            "item": {
-                "id": "1",
-                "name": "New Board"
+    def test_get_lists(self):
+        """Test getting lists from Planka."""
+        # Mock the response; lists are included in GET /boards/{id}
+        self.session.get.return_value = _response({
+            "item": {"id": "1", "name": "Board 1"},
+            "included": {
+                "lists": [
+                    {"id": "1", "name": "List 1"},
+                    {"id": "2", "name": "List 2"}
+                ]
             }
-        }
-        mock_post.return_value = mock_response
+        })
         
         # Create a new client with mocked dependencies
-        client = PlankaClient(config.PLANKA_API_URL, config.PLANKA_API_KEY)
-        board = client.create_board("1", "New Board", "Test board")
+        client = PlankaClient(PLANKA_API_URL, PLANKA_API_KEY)
+        lists = client.get_lists("1")
         
-        self.assertEqual(board["name"], "New Board")
-        # Note: The current implementation doesn't return description
+        self.assertEqual(len(lists), 2)
+        self.assertEqual(lists[0]["name"], "List 1")
+        self.assertEqual(lists[1]["name"], "List 2")
         
     @patch('planka_client.client.Planka')
-    def test_get_lists(self, mock_planka):
-        """Test getting lists from Planka."""
-        # Mock the plankapy client
-        mock_list1 = Mock()
-        mock_list1.id = "1"
-        mock_list1.name = "List 1"
-        
-        mock_list2 = Mock()
-        mock_list2.id = "2"
-        mock_list2.name = "List 2"
-        
-        mock_board = Mock()
-        mock_board.id = "1"  # Make sure the board has the correct ID
-        mock_board.lists = [mock_list1, mock_list2]
-        
-        mock_project = Mock()
-        mock_project.boards = [mock_board]
+    def test_get_lists_does_not_walk_project_tree(self, mock_planka):
+        """Test that reading lists costs one request and no plankapy traversal."""
+        self.session.get.return_value = _response({"item": {"id": "1"}, "included": {"lists": []}})
         
+        mock_projects = PropertyMock(return_value=[])
         mock_planka_instance = Mock()
-        mock_planka_instance.projects = [mock_project]
+        type(mock_planka_instance).projects = mock_projects
         mock_planka.return_value = mock_planka_instance
         
-        # Create a new client with mocked dependencies
-        client = PlankaClient(config.PLANKA_API_URL, config.PLANKA_API_KEY)
-        lists = client.get_lists("1")
-        
-        self.assertEqual(len(lists), 2)
-        self.assertEqual(lists[0]["name"], "List 1")
-        self.assertEqual(lists[1]["name"], "List 2")
-        
-    @patch('planka_client.client.requests.post')
-    def test_create_list(self, mock_post):
-        """Test creating a list in Planka."""
-        # Mock the response
-        mock_response = Mock()
-        mock_response.status_code = 201
-        mock_response.json.return_value = {
-            "item": {
-                "id": "1",
-                "name": "New List"
+        client = PlankaClient(PLANKA_API_URL, PLANKA_API_KEY)
+        client.get_lists("1")
+        
+        self.session.get.assert_called_once_with(f"{client.api_url}/boards/1", timeout=REQUEST_TIMEOUT)
+        self.assertEqual(mock_projects.call_count, 0)
+        
+    def test_get_boards_prefetches_lists(self):
+        """Test that get_boards(prefetch_lists=True) serves get_lists without refetching."""
+        responses = {
+            "/projects": {
+                "items": [{"id": "p1", "name": "Project 1"}],
+                "included": {"boards": [{"id": "1", "name": "Board 1", "projectId": "p1"}]}
+            },
+            "/boards/1": {
+                "item": {"id": "1", "name": "Board 1"},
+                "included": {"lists": [{"id": "10", "name": "To Do"}]}
             }
         }
-        mock_post.return_value = mock_response
         
-        # Create a new client with mocked dependencies
-        client = PlankaClient(config.PLANKA_API_URL, config.PLANKA_API_KEY)
-        list_obj = client.create_list("1", "New List", 65535)
+        def get(url, timeout):
+            return _response(responses[url.split("/api", 1)[1]])
+        self.session.get.side_effect = get
         
-        self.assertEqual(list_obj["name"], "New List")
-        # Note: The current implementation doesn't return position
+        client = PlankaClient(PLANKA_API_URL, PLANKA_API_KEY)
+        client.get_boards(prefetch_lists=True)
+        lists = client.get_lists("1")
+        
+        self.assertEqual(lists, [{'id': "10", 'name': "To Do"}])
+        self.assertEqual(self.session.get.call_count, 2)
+        
+        # Prefetched lists must not outlive an invalidation
+        client.invalidate_cache()
+        client.get_lists("1")
+        self.assertEqual(self.session.get.call_count, 3)
         
     @patch('planka_client.client.Planka')
     def test_get_cards(self, mock_planka):
         """Test getting cards from Planka."""
-        # Mock the plankapy client
-        mock_card1 = Mock()
-        mock_card1.id = "1"
-        mock_card1.name = "Card 1"
-        
-        mock_card2 = Mock()
-        mock_card2.id = "2"
-        mock_card2.name = "Card 2"
-        
-        mock_list = Mock()
-        mock_list.id = "1"  # Make sure the list has the correct ID
-        mock_list.cards = [mock_card1, mock_card2]
-        
-        mock_board = Mock()
-        mock_board.lists = [mock_list]
-        
-        mock_project = Mock()
-        mock_project.boards = [mock_board]
+        # Mock the responses; the index walk reads the tree from the JSON API only
+        responses = {
+            "/projects": {
+                "items": [{"id": "p1", "name": "Project 1"}],
+                "included": {"boards": [{"id": "b1", "name": "Board 1", "projectId": "p1"}]}
+            },
+            "/boards/b1": {
+                "item": {"id": "b1", "name": "Board 1"},
+                "included": {
+                    "lists": [{"id": "1", "name": "List 1", "boardId": "b1"}],
+                    "cards": [
+                        {"id": "1", "name": "Card 1", "listId": "1"},
+                        {"id": "2", "name": "Card 2", "listId": "1"},
+                        {"id": "3", "name": "Card 3", "listId": "2"}
+                    ]
+                }
+            }
+        }
         
-        mock_planka_instance = Mock()
-        mock_planka_instance.projects = [mock_project]
-        mock_planka.return_value = mock_planka_instance
+        def get(url, timeout):
+            return _response(responses[url.split("/api", 1)[1]])
+        self.session.get.side_effect = get
         
         # Create a new client with mocked dependencies
-        client = PlankaClient(config.PLANKA_API_URL, config.PLANKA_API_KEY)
+        client = PlankaClient(PLANKA_API_URL, PLANKA_API_KEY)
         cards = client.get_cards("1")
         
         self.assertEqual(len(cards), 2)
         self.assertEqual(cards[0]["name"], "Card 1")
         self.assertEqual(cards[1]["name"], "Card 2")
-        
-    @patch('planka_client.client.requests.post')
-    def test_create_card(self, mock_post):
-        """Test creating a card in Planka."""
-        # Mock the response
-        mock_response = Mock()
-        mock_response.status_code = 201
-        mock_response.json.return_value = {
-            "item": {
-                "id": "1",
-                "name": "New Card"
-            }
-        }
-        mock_post.return_value = mock_response
-        
-        # Create a new client with mocked dependencies
-        client = PlankaClient(config.PLANKA_API_URL, config.PLANKA_API_KEY)
-        card = client.create_card("1", "New Card", "Test card", 65535)
-        
-        self.assertEqual(card["name"], "New Card")
-        # Note: The current implementation doesn't return description or position
-        
-    @patch('planka_client.client.Planka')
-    def test_get_users(self, mock_planka):
+        self.assertEqual(client._card_parent["3"], "2")
+        mock_planka.assert_not_called()
+        
+    def test_upload_attachment_streams_a_rewindable_multipart_body(self):
+        """Test that the streamed multipart body has the right length and parts, and reads the same after seek(0)."""
+        content = b"hello\r\nworld\n" * 10000
+        sent = {}
+        
+        def post(url, data, headers, timeout):
+            # Let requests compute the Content-Length it would send for this body
+            prepared = requests.Request("POST", url, data=data, headers=headers).prepare()
+            sent["content_length"] = int(prepared.headers["Content-Length"])
+            sent["content_type"] = headers["Content-Type"]
+            sent["body"] = data.read()
+            # What urllib3 does before retrying the POST on a 429
+            data.seek(0)
+            sent["replayed"] = data.read()
+            return _response({"item": {"id": "a1", "name": "notes.txt"}}, 200)
+        self.session.post.side_effect = post
+        
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            file_path = os.path.join(tmp_dir, "notes.txt")
+            with open(file_path, "wb") as f:
+                f.write(content)
+            
+            client = PlankaClient(PLANKA_API_URL, PLANKA_API_KEY)
+            result = client.upload_attachment("c1", file_path)
+        
+        self.assertEqual(result, {"id": "a1", "name": "notes.txt"})
+        self.assertEqual(sent["content_length"], len(sent["body"]))
+        self.assertEqual(sent["replayed"], sent["body"])
+        
+        header = f"Content-Type: {sent['content_type']}\r\n\r\n".encode()
+        message = BytesParser(policy=HTTP).parsebytes(header + sent["body"])
+        parts = {part.get_param("name", header="content-disposition"): part for part in message.iter_parts()}
+        self.assertEqual(list(parts), ["file", "name", "type"])
+        self.assertEqual(parts["file"].get_filename(), "notes.txt")
+        self.assertEqual(parts["file"].get_payload(decode=True), content)
+        self.assertEqual(parts["name"].get_payload(decode=True), b"notes.txt")
+        self.assertEqual(parts["type"].get_payload(decode=True), b"file")
+        
+    def test_get_users(self):
         """Test getting users from Planka."""
-        # Mock the plankapy client
-        mock_user1 = Mock()
-        mock_user1.id = "1"
-        mock_user1.name = "User 1"
-        mock_user1.username = "user1"
-        
-        mock_user2 = Mock()
-        mock_user2.id = "2"
-        mock_user2.name = "User 2"
-        mock_user2.username = "user2"
-        
-        mock_planka_instance = Mock()
-        mock_planka_instance.users = [mock_user1, mock_user2]
-        mock_planka.return_value = mock_planka_instance
+        # Mock the response
+        self.session.get.return_value = _response({
+            "items": [
+                {"id": "1", "name": "User 1", "username": "user1", "email": "user1@example.com"},
+                {"id": "2", "name": "User 2", "username": "user2", "email": "user2@example.com"}
+            ]
+        })
         
         # Create a new client with mocked dependencies
-        client = PlankaClient(config.PLANKA_API_URL, config.PLANKA_API_KEY)
+        client = PlankaClient(PLANKA_API_URL, PLANKA_API_KEY)
         users = client.get_users()
         
         self.assertEqual(len(users), 2)
         self.assertEqual(users[0]["name"], "User 1")
         self.assertEqual(users[1]["name"], "User 2")
+        self.assertEqual(users[0]["email"], "user1@example.com")
         
     @patch('planka_client.client.Planka')
     def test_create_user(self, mock_planka):
@@ -264,66 +302,139 @@ class TestPlankaClient(unittest.TestCase):
         mock_planka.return_value = mock_planka_instance
         
         # Create a new client with mocked dependencies
-        client = PlankaClient(config.PLANKA_API_URL, config.PLANKA_API_KEY)
+        client = PlankaClient(PLANKA_API_URL, PLANKA_API_KEY)
         user = client.create_user("New User", "newuser@example.com", "newuser", "password123")
         
         self.assertEqual(user["name"], "New User")
         self.assertEqual(user["username"], "newuser")
         
-    @patch('planka_client.client.Planka')
-    def test_get_labels(self, mock_planka):
+    def test_get_labels(self):
         """Test getting labels from Planka."""
-        # Mock the plankapy client
-        mock_label1 = Mock()
-        mock_label1.id = "1"
-        mock_label1.name = "Label 1"
-        mock_label1.color = "#FF0000"
-        
-        mock_label2 = Mock()
-        mock_label2.id = "2"
-        mock_label2.name = "Label 2"
-        mock_label2.color = "#00FF00"
-        
-        mock_board = Mock()
-        mock_board.id = "1"  # Make sure the board has the correct ID
-        mock_board.labels = [mock_label1, mock_label2]
-        
-        mock_project = Mock()
-        mock_project.boards = [mock_board]
-        
-        mock_planka_instance = Mock()
-        mock_planka_instance.projects = [mock_project]
-        mock_planka.return_value = mock_planka_instance
+        # Mock the response; labels are included in GET /boards/{id}
+        self.session.get.return_value = _response({
+            "item": {"id": "1", "name": "Board 1"},
+            "included": {
+                "labels": [
+                    {"id": "1", "name": "Label 1", "color": "#FF0000"},
+                    {"id": "2", "name": "Label 2", "color": "#00FF00"}
+                ]
+            }
+        })
         
         # Create a new client with mocked dependencies
-        client = PlankaClient(config.PLANKA_API_URL, config.PLANKA_API_KEY)
+        client = PlankaClient(PLANKA_API_URL, PLANKA_API_KEY)
         labels = client.get_labels("1")
         
         self.assertEqual(len(labels), 2)
         self.assertEqual(labels[0]["name"], "Label 1")
         self.assertEqual(labels[1]["name"], "Label 2")
         
-    @patch('planka_client.client.requests.post')
-    def test_create_label(self, mock_post):
-        """Test creating a label in Planka."""
-        # Mock the response
-        mock_response = Mock()
-        mock_response.status_code = 201
-        mock_response.json.return_value = {
-            "item": {
-                "id": "1",
-                "name": "New Label",
-                "color": "#CCCCCC"
-            }
-        }
-        mock_post.return_value = mock_response
+    def test_add_label_to_card(self):
+        """Test that adding a label is a single request by id."""
+        self.session.post.return_value = _response({"item": {"id": "cl1", "labelId": "lb1"}}, 200)
         
-        # Create a new client with mocked dependencies
-        client = PlankaClient(config.PLANKA_API_URL, config.PLANKA_API_KEY)
-        label = client.create_label("1", "New Label", "#CCCCCC")
+        client = PlankaClient(PLANKA_API_URL, PLANKA_API_KEY)
+        card_label = client.add_label_to_card("c1", "lb1")
+        
+        self.assertEqual(card_label, {'id': "cl1", 'labelId': "lb1"})
+        self.session.post.assert_called_once_with(
+            f"{client.api_url}/cards/c1/card-labels", json={"labelId": "lb1"}, timeout=REQUEST_TIMEOUT
+        )
+        
+    def test_delete_board_with_contents_cascades(self):
+        """Test that deleting a board sends a single DELETE request."""
+        self.session.delete.return_value = _response(status_code=200)
         
-        self.assertEqual(label["name"], "New Label")
-        self.assertEqual(label["color"], "#CCCCCC")
+        client = PlankaClient(PLANKA_API_URL, PLANKA_API_KEY)
+        result = client.delete_board_with_contents("1")
+        
+        self.assertTrue(result)
+        self.session.delete.assert_called_once_with(f"{client.api_url}/boards/1", timeout=REQUEST_TIMEOUT)
+        
+    @patch('planka_client.client.Planka')
+    def test_delete_board_with_contents_without_cascade(self, mock_planka):
+        """Test that every card and list is deleted by id before the board."""
+        self.session.get.return_value = _response({
+            "item": {"id": "1"},
+            "included": {
+                "lists": [{"id": "l1"}, {"id": "l2"}],
+                "cards": [{"id": str(i), "listId": "l1" if i < 2 else "l2"} for i in range(4)]
+            }
+        })
+        self.session.delete.return_value = _response(status_code=200)
+        
+        client = PlankaClient(PLANKA_API_URL, PLANKA_API_KEY)
+        result = client.delete_board_with_contents("1", cascade=False)
+        
+        self.assertTrue(result)
+        urls = [c.args[0].split("/api", 1)[1] for c in self.session.delete.call_args_list]
+        self.assertCountEqual(urls[:4], ["/cards/0", "/cards/1", "/cards/2", "/cards/3"])
+        self.assertCountEqual(urls[4:6], ["/lists/l1", "/lists/l2"])
+        self.assertEqual(urls[6:], ["/boards/1"])
+        mock_planka.assert_not_called()
+        
+    def test_delete_empty_project_without_walking_boards(self):
+        """Test that a project is deleted directly when Planka accepts it."""
+        self.session.delete.return_value = _response(status_code=200)
+        
+        client = PlankaClient(PLANKA_API_URL, PLANKA_API_KEY)
+        result = client.delete_project("1")
+        
+        self.assertTrue(result)
+        self.session.delete.assert_called_once_with(f"{client.api_url}/projects/1", timeout=REQUEST_TIMEOUT)
+        self.assertIsNone(client._indexes_built_at)
+        
+    def test_delete_project_deletes_its_boards_first(self):
+        """Test that the boards of a non-empty project are found over the JSON API and deleted."""
+        self.session.delete.side_effect = [
+            _response(status_code=422),
+            _response(status_code=200),
+            _response(status_code=200)
+        ]
+        self.session.get.return_value = _response({
+            "item": {"id": "1"},
+            "included": {"boards": [{"id": "b1", "projectId": "1"}]}
+        })
+        
+        client = PlankaClient(PLANKA_API_URL, PLANKA_API_KEY)
+        result = client.delete_project("1")
+        
+        self.assertTrue(result)
+        self.session.get.assert_called_once_with(f"{client.api_url}/projects/1", timeout=REQUEST_TIMEOUT)
+        urls = [c.args[0].split("/api", 1)[1] for c in self.session.delete.call_args_list]
+        self.assertEqual(urls, ["/projects/1", "/boards/b1", "/projects/1"])
+        
+    @patch('planka_client.client.Planka')
+    def test_task_lists_are_created_through_the_session(self, mock_planka):
+        """Test that checklists and their items are POSTed by id, never through plankapy."""
+        self.session.post.side_effect = [
+            _response({"item": {"id": "t1", "name": "Checklist"}}, 200),
+            _response({"item": {"id": "i1", "name": "Item", "isCompleted": True}}, 200)
+        ]
+        
+        client = PlankaClient(PLANKA_API_URL, PLANKA_API_KEY)
+        task_list = client.create_task_list("c1", "Checklist")
+        task = client.create_task_in_list("t1", "Item", is_completed=True, position=0)
+        
+        self.assertEqual(task_list, {"id": "t1", "name": "Checklist"})
+        self.assertEqual(task, {"id": "i1", "name": "Item", "isCompleted": True})
+        self.session.post.assert_any_call(
+            f"{client.api_url}/cards/c1/task-lists", json={"name": "Checklist", "position": 65535}, timeout=REQUEST_TIMEOUT
+        )
+        self.session.post.assert_any_call(
+            f"{client.api_url}/task-lists/t1/tasks", json={"name": "Item", "isCompleted": True, "position": 0},
+            timeout=REQUEST_TIMEOUT
+        )
+        mock_planka.assert_not_called()
+        
+    def test_retry_policy_only_retries_post_on_429(self):
+        """Test that POST is retried on 429 but not on gateway errors."""
+        retry = _PlankaRetry(total=5, status_forcelist=[429, 502, 503, 504],
+                             allowed_methods=frozenset(["GET", "DELETE"]))
+        
+        self.assertTrue(retry.is_retry("POST", 429))
+        self.assertFalse(retry.is_retry("POST", 502))
+        self.assertTrue(retry.is_retry("DELETE", 502))
 
 
 if __name__ == '__main__':
@@ -3,71 +3,107 @@
 Utility script for common tasks related to the Kaiten to Planka migration.
 """
 
-import os
 import sys
 import argparse
-
-# Add current directory to Python path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from concurrent.futures import ThreadPoolExecutor
 
 from kaiten_client import KaitenClient
 from planka_client import PlankaClient
 import config
 
-def test_kaiten_connection():
-    """Test connection to Kaiten API."""
-    print("Testing Kaiten connection...")
+def create_kaiten_client():
+    """Build a KaitenClient from the configuration, as main.py does."""
+    return KaitenClient(
+        api_url=config.KAITEN_API_URL,
+        api_key=config.KAITEN_API_KEY,
+        pool_size=config.KAITEN_POOL_SIZE,
+        rpm_limit=config.KAITEN_RPM_LIMIT
+    )
+
+def create_planka_client():
+    """Build a PlankaClient from the configuration."""
+    return PlankaClient(
+        api_url=config.PLANKA_API_URL,
+        api_key=config.PLANKA_API_KEY
+    )
+
+def test_kaiten_connection(kaiten_client=None):
+    """Test connection to Kaiten API, reusing kaiten_client if one is given."""
+    # Collected and written once, so the concurrent test-both probes don't interleave
+    lines = ["Testing Kaiten connection..."]
     try:
-        kaiten_client = KaitenClient(
-            api_url=config.KAITEN_API_URL,
-            api_key=config.KAITEN_API_KEY
-        )
+        if kaiten_client is None:
+            kaiten_client = create_kaiten_client()
         boards = kaiten_client.get_boards()
-        print(f"✓ Successfully connected to Kaiten. Found {len(boards)} boards.")
+        lines.append(f"✓ Successfully connected to Kaiten. Found {len(boards)} boards.")
         return True
     except Exception as e:
-        print(f"✗ Failed to connect to Kaiten: {e}")
+        lines.append(f"✗ Failed to connect to Kaiten: {e}")
         return False
+    finally:
+        sys.stdout.write("\n".join(lines) + "\n")
 
-def test_planka_connection():
-    """Test connection to Planka API."""
-    print("Testing Planka connection...")
+def test_planka_connection(planka_client=None):
+    """Test connection to Planka API, reusing planka_client if one is given."""
+    # Collected and written once, so the concurrent test-both probes don't interleave
+    lines = ["Testing Planka connection..."]
     try:
-        planka_client = PlankaClient(
-            api_url=config.PLANKA_API_URL,
-            api_key=config.PLANKA_API_KEY
-        )
+        if planka_client is None:
+            planka_client = create_planka_client()
         projects = planka_client.get_projects()
-        print(f"✓ Successfully connected to Planka. Found {len(projects)} projects.")
+        lines.append(f"✓ Successfully connected to Planka. Found {len(projects)} projects.")
         return True
     except Exception as e:
-        print(f"✗ Failed to connect to Planka: {e}")
+        lines.append(f"✗ Failed to connect to Planka: {e}")
         return False
+    finally:
+        sys.stdout.write("\n".join(lines) + "\n")
 
-def main():
-    """Main function to run utility tasks."""
-    parser = argparse.ArgumentParser(description="Kaiten to Planka migration utilities")
-    parser.add_argument(
-        "task",
-        choices=["test-kaiten", "test-planka", "test-both"],
-        help="Task to perform"
-    )
-    
-    args = parser.parse_args()
+_PARSER = argparse.ArgumentParser(description="Kaiten to Planka migration utilities")
+_PARSER.add_argument(
+    "task",
+    choices=["test-kaiten", "test-planka", "test-both"],
+    help="Task to perform"
+)
+_PARSER.add_argument(
+    "--fail-fast",
+    action="store_true",
+    help="test-both: probe Kaiten first and skip Planka if it fails, instead of probing both at once"
+)
+
+def main(argv=None):
+    """Main function to run utility tasks; argv defaults to sys.argv[1:]."""
+    args = _PARSER.parse_args(argv)
     
-    if args.task == "test-kaiten":
-        test_kaiten_connection()
-    elif args.task == "test-planka":
-        test_planka_connection()
-    elif args.task == "test-both":
-        kaiten_success = test_kaiten_connection()
-        planka_success = test_planka_connection()
-        
-        if kaiten_success and planka_success:
-            print("\n✓ Both connections successful! You're ready to run the migration.")
-        else:
-            print("\n✗ One or both connections failed. Please check your configuration.")
-            sys.exit(1)
+    # Each client is built once here and shared by the probes that need it
+    kaiten_client = create_kaiten_client() if args.task in ("test-kaiten", "test-both") else None
+    planka_client = create_planka_client() if args.task in ("test-planka", "test-both") else None
+    try:
+        if args.task == "test-kaiten":
+            test_kaiten_connection(kaiten_client)
+        elif args.task == "test-planka":
+            test_planka_connection(planka_client)
+        elif args.task == "test-both":
+            if args.fail_fast:
+                # A failed Kaiten probe already means exit 1, so save the Planka round trip
+                kaiten_success = test_kaiten_connection(kaiten_client)
+                planka_success = kaiten_success and test_planka_connection(planka_client)
+            else:
+                # The two probes are independent, so wait on both round trips at once
+                with ThreadPoolExecutor(max_workers=2) as executor:
+                    kaiten_future = executor.submit(test_kaiten_connection, kaiten_client)
+                    planka_future = executor.submit(test_planka_connection, planka_client)
+                    kaiten_success, planka_success = kaiten_future.result(), planka_future.result()
+            
+            if kaiten_success and planka_success:
+                print("\n✓ Both connections successful! You're ready to run the migration.")
+            else:
+                print("\n✗ One or both connections failed. Please check your configuration.")
+                sys.exit(1)
+    finally:
+        for client in (kaiten_client, planka_client):
+            if client is not None:
+                client.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file